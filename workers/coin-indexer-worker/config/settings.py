@@ -1,6 +1,8 @@
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional
+from types import MappingProxyType
+import functools
 import os
 import json
 from pathlib import Path
@@ -192,13 +194,19 @@ class ChainConfig:
         )
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings (parsed once; call get_settings.cache_clear() to reload)."""
     return Settings()
 
 
-def load_chain_configs() -> Dict[int, ChainConfig]:
-    """Load all chain configurations from JSON files in chains/ directory."""
+@functools.lru_cache(maxsize=1)
+def load_chain_configs() -> Mapping[int, ChainConfig]:
+    """
+    Load all chain configurations from JSON files in chains/ directory.
+    
+    The result is cached and read-only; call load_chain_configs.cache_clear() to reload.
+    """
     configs = {}
     config_dir = Path(__file__).parent / "chains"
     
@@ -222,4 +230,4 @@ def load_chain_configs() -> Dict[int, ChainConfig]:
         except Exception as e:
             print(f"Failed to load chain config {config_file}: {e}")
     
-    return configs
+    return MappingProxyType(configs)
@@ -206,6 +206,24 @@ class BlockExplorerURLs:
         url = f"{explorer['base_url']}{explorer['block_path']}{block_number}"
         return url
     
+    def get_url_template(self, chain_id: int, path_key: str) -> Optional[str]:
+        """
+        Get a printf-style URL template for a chain and path type.
+        
+        Args:
+            chain_id: Blockchain network chain ID
+            path_key: Explorer path key (e.g. 'address_path', 'tx_path', 'token_path')
+            
+        Returns:
+            URL template with a single ``%s`` placeholder, or None if chain not supported
+        """
+        explorer = self.get_explorer_info(chain_id)
+        if not explorer or path_key not in explorer:
+            return None
+        
+        base = f"{explorer['base_url']}{explorer[path_key]}".replace('%', '%%')
+        return f"{base}%s"
+    
     def get_explorer_name(self, chain_id: int) -> str:
         """
         Get the name of the block explorer for a chain.
@@ -1,17 +1,245 @@
 """Telegram notification service for token events."""
 
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Set, Tuple
 import structlog
 import asyncio
+import functools
+import logging
+import re
+import time
 import aiohttp
-import json
-from datetime import datetime
-from web3 import Web3
+import orjson
+from datetime import datetime, timezone
 
 from .ens_resolver import ENSResolver
 from .block_explorer import BlockExplorerURLs
 
-logger = structlog.get_logger(__name__)
+logger = structlog.get_logger(__name__, component="telegram_notifier")
+
+# Bounded send pipeline: at most SEND_WORKER_COUNT requests in flight,
+# producers wait once SEND_QUEUE_MAXSIZE sends are pending
+SEND_QUEUE_MAXSIZE = 1024
+SEND_WORKER_COUNT = 16
+SEND_DRAIN_TIMEOUT_SECONDS = 30
+
+# Photo sends bypass the queue, so cap how many run at once
+PHOTO_SEND_CONCURRENCY = 8
+
+# Request timeouts (ClientTimeout is immutable, so build them once)
+_SEND_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_connect=5, sock_read=25)
+_PHOTO_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_TIMEOUT_SHORT = aiohttp.ClientTimeout(total=10)
+_TIMEOUT_LONG = aiohttp.ClientTimeout(total=15)
+
+# Connection pool for the shared session (Telegram, Zora, Farcaster, IPFS gateways)
+_CONNECTOR_LIMIT = 100
+_CONNECTOR_LIMIT_PER_HOST = 32
+_KEEPALIVE_TIMEOUT_SECONDS = 75
+_DNS_CACHE_TTL_SECONDS = 300
+
+# ENS lookups are cached per address; misses expire sooner so new names show up
+_ENS_CACHE_TTL_SECONDS = 900
+_ENS_NEGATIVE_CACHE_TTL_SECONDS = 60
+_ENS_CACHE_MAXSIZE = 4096
+
+# Tree glyphs for message branches; social links in Retake messages nest one level deeper
+_TREE_MID = "├── "
+_TREE_END = "└── "
+_SOCIAL_TREE_INDENT = "      "
+
+# Zora social account key, profile URL prefix and link label, in display order
+_SOCIAL_SPECS = (
+    ("twitter", "https://x.com/", "𝕏"),
+    ("farcaster", "https://farcaster.xyz/", "🟣"),
+    ("instagram", "https://instagram.com/", "📷"),
+    ("tiktok", "https://tiktok.com/@", "🎵"),
+)
+
+# Notification layouts shared by all notifier instances, keyed by message type.
+# In "retake", {stream_branch} is the tree glyph of the Stream line and
+# {tree_items} the optional lines below it; "clanker" works the same way
+# with {admin_branch}. "zora" is the enhanced Zora header, whose optional
+# lines are appended after the {stats_branch} block. "footer" follows a
+# blank line in builders assembled piecewise.
+_MESSAGE_TEMPLATES = {
+    "clanker": (
+        "{icon} <b>New Token:</b> {name} ({symbol})\n"
+        "├── <b>CA:</b> <code>{token_address}</code>\n"
+        "├── <b>Creator:</b> {creator_display}\n"
+        "{admin_branch} <b>Admin:</b> {admin_display}{tree_items}"
+    ),
+    "retake": (
+        "🎬 <b>Retake Token:</b> {name} ({symbol})\n"
+        "├── <b>CA:</b> <code>{token_address}</code>\n"
+        "├── <b>Creator:</b> {creator_display}\n"
+        "├── <b>Admin:</b> {admin_display}\n"
+        "{stream_branch} <b>Stream:</b> <a href=\"{retake_url}\">Watch Live</a>{tree_items}\n"
+        "\n"
+        "<b>Network:</b> {chain_name} • Clanker (Retake) • Block #{block_number}\n"
+        "<b>Created:</b> {tx_link} • {created_at} {relative_time}"
+    ),
+    "zora": (
+        "🎨 <b>Zora Token:</b> {display_name} ({symbol})\n"
+        "├── <b>CA:</b> <code>{token_address}</code>\n"
+        "├── <b>Creator:</b> {creator_display}\n"
+        "├── <b>Profile:</b> <a href=\"{zora_profile_link}\">@{clean_name}</a> {verified_emoji}\n"
+        "{stats_branch} <b>Stats:</b>\n"
+        "│   ├── Market Cap: ${market_cap} ({delta_formatted})\n"
+        "│   ├── 24h Vol: ${volume_24h} • Total: ${total_volume}\n"
+        "│   ├── Holders: {unique_holders}\n"
+        "│   └── Followers: {followers} • Following: {following}"
+    ),
+    "zora_basic": (
+        "🎨 <b>Zora Token:</b> {name} ({symbol})\n"
+        "├── <b>CA:</b> <code>{token_address}</code>\n"
+        "├── <b>Creator:</b> {creator_display}\n"
+        "└── <b>Profile:</b> <a href=\"{zora_profile_link}\">@{clean_name}</a>\n"
+        "\n"
+        "<b>Network:</b> {chain_name} • Zora • Block #{block_number}\n"
+        "<b>Created:</b> {tx_link} • {created_at} {relative_time}"
+    ),
+    "footer": (
+        "<b>Network:</b> {chain_name} • {source_label} • Block #{block_number}\n"
+        "<b>Created:</b> {tx_link} • {created_at} {relative_time}"
+    ),
+}
+
+
+def _render_message(template_name: str, **context: Any) -> str:
+    """Render a notification layout from _MESSAGE_TEMPLATES."""
+    return _MESSAGE_TEMPLATES[template_name].format_map(context)
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _render_tree(items: List[str], indent: str = "") -> str:
+    """Render items as tree branches, each on its own line (leading newline included)."""
+    if not items:
+        return ""
+    last = len(items) - 1
+    return "".join([
+        f"\n{indent}{_TREE_END if i == last else _TREE_MID}{item}"
+        for i, item in enumerate(items)
+    ])
+
+
+# (threshold, divisor, suffix) for compact number formatting, largest first
+_COMPACT_UNITS = (
+    (1_000_000_000, 1_000_000_000, "B"),
+    (1_000_000, 1_000_000, "M"),
+    (1_000, 1_000, "K"),
+)
+
+# 0x-prefixed 20-byte hex address (format check only, no checksum validation)
+_HEX_ADDRESS_MATCH = re.compile(r'^0x[0-9a-fA-F]{40}$').match
+
+# Public IPFS gateways, tried in order when fetching ipfs:// metadata
+_IPFS_GATEWAYS = (
+    "https://ipfs.io/ipfs/",
+    "https://dweb.link/ipfs/",
+    "https://nftstorage.link/ipfs/",
+    "https://w3s.link/ipfs/",
+)
+
+# Token metadata gateway requests kept in flight at once
+_METADATA_FETCH_CONCURRENCY = 2
+
+# Plain-text token_info fields checked, in order, for a Clanker description
+_METADATA_FIELDS = (
+    "additional_metadata",
+    "additionalMetadata",
+    "extra_metadata",
+    "metadata_extra",
+    "token_description",
+    "description",
+)
+
+# Metadata URI schemes that qualify a token for notification
+_VALID_METADATA_PREFIXES = ("ipfs://", "https://")
+
+# sendMessage bodies are pre-encoded JSON bytes (orjson keeps UTF-8 glyphs unescaped)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@functools.lru_cache(maxsize=64)
+def _source_display_name(source: str) -> str:
+    """Map a token source to its display name ('Clanker' or 'Zora')."""
+    return 'Clanker' if 'clanker' in source.lower().strip() else 'Zora'
+
+
+@functools.lru_cache(maxsize=4096)
+def _zora_profile_link(token_name: Optional[str], source: str) -> Optional[str]:
+    """Build the Zora profile URL for a token, or None if not applicable."""
+    # Only create Zora profile links for non-Clanker tokens
+    if _source_display_name(source) == "Zora" and token_name and token_name != "Unknown":
+        # Don't create profile link if name contains spaces
+        if ' ' in token_name:
+            return None
+        
+        # Clean token name for URL (remove special chars, convert to lowercase)
+        clean_name = token_name.lower().replace('-', '').replace('_', '')
+        if clean_name and clean_name.isalnum():  # Only alphanumeric characters
+            return f"https://zora.co/@{clean_name}"
+    
+    return None
+
+
+def _datetime_to_unix(value: datetime) -> float:
+    """Convert a datetime to a Unix timestamp, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso_timestamp(value: str) -> Optional[float]:
+    """Parse an ISO 8601 string to a Unix timestamp, or None if invalid."""
+    try:
+        return _datetime_to_unix(datetime.fromisoformat(value.replace('Z', '+00:00')))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_metadata_json(raw: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a token metadata JSON string, memoized per raw payload.
+    
+    Returns the parsed object if it is a dict, None otherwise. The result is
+    shared between callers and must not be mutated.
+    """
+    try:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _photo_file_id(message: Dict[str, Any]) -> Optional[str]:
+    """file_id of the largest photo size in a sent Telegram message, if any."""
+    photos = message.get("photo")
+    if isinstance(photos, list) and photos and isinstance(photos[-1], dict):
+        return photos[-1].get("file_id")
+    return None
+
+
+async def _resolved(value: Any) -> Any:
+    """Awaitable placeholder for an optional branch of asyncio.gather."""
+    return value
+
+
+def _is_address_fast(address: Optional[str]) -> bool:
+    """Cheap address shape check used for display formatting."""
+    return address is not None and len(address) == 42 and _HEX_ADDRESS_MATCH(address) is not None
+
+
+@functools.lru_cache(maxsize=2048)
+def _shorten_address(address: str) -> str:
+    """Shorten an address to 5 leading + 4 trailing characters."""
+    return f"{address[:5]}...{address[-4:]}"
 
 
 class TelegramNotifier:
@@ -23,6 +251,7 @@ class TelegramNotifier:
                  retake_chat_ids: Optional[List[str]] = None):
         """Initialize Telegram notifier with bot token and list of chat IDs."""
         self.bot_token = bot_token
+        bot_id = bot_token.split(':')[0] if bot_token and ':' in bot_token else 'unknown'
         
         # Validate bot token format
         if not self._validate_bot_token(bot_token):
@@ -31,8 +260,6 @@ class TelegramNotifier:
                           token_example="123456789:ABCdefGHIjklMNOpqrsTUVwxyz",
                           received_token_format=f"Received: {bot_token[:20]}..." if bot_token else "None")
         else:
-            # Extract bot ID for logging
-            bot_id = bot_token.split(':')[0] if ':' in bot_token else 'unknown'
             logger.info("Bot token format is valid", bot_id=bot_id)
         
         # Debug log received chat_ids
@@ -49,6 +276,10 @@ class TelegramNotifier:
         logger.debug("TelegramNotifier processed chat_ids", 
                     final_chat_ids=self.chat_ids)
         
+        # Logger with per-notifier context bound once
+        self._log = logger.bind(bot_id=bot_id, chat_count=len(self.chat_ids))
+        self.refresh_log_level()
+        
         # Setup retake chat IDs (separate channel for Retake tokens)
         if retake_chat_ids:
             if isinstance(retake_chat_ids, list):
@@ -61,68 +292,146 @@ class TelegramNotifier:
         logger.debug("TelegramNotifier processed retake_chat_ids", 
                     retake_chat_ids=self.retake_chat_ids)
         
+        # Chat IDs are fixed after init, so encode them for the POST body once
+        self._chat_id_bytes = self._encode_chat_ids(self.chat_ids)
+        self._retake_chat_id_bytes = self._encode_chat_ids(self.retake_chat_ids)
+        
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
         self.session: Optional[aiohttp.ClientSession] = None
         self.is_connected = False
         
+        # Send queue and worker tasks (created on connect)
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._send_workers: List[asyncio.Task] = []
+        self._photo_send_sem = asyncio.Semaphore(PHOTO_SEND_CONCURRENCY)
+        # Sends still running after their caller returned (kept referenced until done)
+        self._bg_tasks: Set[asyncio.Task] = set()
+        
+        # (unix minute, formatted UTC timestamp) for message footers
+        self._ts_cache: Tuple[int, str] = (-1, "")
+        
         # ENS resolution and block explorer utilities
         self.ens_resolver = ens_resolver
         self.block_explorer = block_explorer or BlockExplorerURLs()
+        
+        # address (lowercase) -> (expires_at monotonic, ENS name or None)
+        self._ens_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        
+        # Per-chain explorer URL templates, resolved once instead of per notification
+        self._address_templates = self._build_url_templates("address_path")
+        self._token_templates = self._build_url_templates("token_path")
+        self._tx_templates = self._build_url_templates("tx_path")
+        
+        # Creator, admin and wallet addresses recur across notifications, so
+        # memoize their explorer URLs per (chain_id, address)
+        self._address_url = functools.lru_cache(maxsize=4096)(self._build_address_url)
+        self._token_url = functools.lru_cache(maxsize=4096)(self._build_token_url)
+    
+    def refresh_log_level(self) -> None:
+        """Re-read whether debug logging is enabled (call after reconfiguring logging)."""
+        self._debug_enabled = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+    
+    def _now_str(self) -> str:
+        """Current UTC time for message footers, formatted once per minute."""
+        now = time.time()
+        minute = int(now // 60)
+        cached_minute, cached_str = self._ts_cache
+        if minute == cached_minute:
+            return cached_str
+        formatted = datetime.fromtimestamp(now, timezone.utc).strftime('%d-%m-%Y %H:%M UTC')
+        self._ts_cache = (minute, formatted)
+        return formatted
+    
+    def _build_address_url(self, chain_id: int, address: str) -> Optional[str]:
+        """Build explorer URL for an address (use the cached self._address_url)."""
+        template = self._address_templates.get(chain_id)
+        if template:
+            return template % address
+        return self.block_explorer.get_address_url(chain_id, address)
+    
+    def _build_token_url(self, chain_id: int, address: str) -> Optional[str]:
+        """Build explorer URL for a token (use the cached self._token_url)."""
+        template = self._token_templates.get(chain_id)
+        if template:
+            return template % address
+        return self.block_explorer.get_token_url(chain_id, address)
+    
+    def _tx_url(self, chain_id: int, tx_hash: str) -> Optional[str]:
+        """Build explorer URL for a transaction (not cached: hashes never repeat)."""
+        template = self._tx_templates.get(chain_id)
+        if template:
+            return template % (tx_hash if tx_hash.startswith('0x') else f"0x{tx_hash}")
+        return self.block_explorer.get_transaction_url(chain_id, tx_hash)
+    
+    def _build_url_templates(self, path_key: str) -> Dict[int, str]:
+        """Build chain_id -> URL template mapping for all supported explorer chains."""
+        templates = {}
+        for chain_id in self.block_explorer.get_supported_chains():
+            template = self.block_explorer.get_url_template(chain_id, path_key)
+            if template:
+                templates[chain_id] = template
+        return templates
     
     async def connect(self) -> None:
         """Connect to Telegram API with timeout and graceful error handling."""
         try:
-            # Create session with timeout
-            timeout = aiohttp.ClientTimeout(total=10.0)  # 10 second timeout
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            # Create long-lived session with a keepalive connection pool
+            connector = aiohttp.TCPConnector(
+                limit=_CONNECTOR_LIMIT,
+                limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+                ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(connector=connector, timeout=_TIMEOUT_SHORT)
             
             # Build and log the full API URL for debugging
             api_url = f"{self.base_url}/getMe"
-            logger.info("Attempting to connect to Telegram Bot API", 
-                       base_url=self.base_url,
-                       full_api_url=api_url,
-                       chat_count=len(self.chat_ids))
+            self._log.info("Attempting to connect to Telegram Bot API", 
+                          base_url=self.base_url,
+                          full_api_url=api_url)
             
             # Test connection by getting bot info
             async with self.session.get(api_url) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     if data.get("ok"):
                         bot_info = data.get("result", {})
                         self.is_connected = True
-                        logger.info("Successfully connected to Telegram Bot API", 
-                                   bot_username=bot_info.get("username"),
-                                   bot_name=bot_info.get("first_name"),
-                                   bot_id=bot_info.get("id"))
+                        self._start_send_workers()
+                        self._log.info("Successfully connected to Telegram Bot API", 
+                                      bot_username=bot_info.get("username"),
+                                      bot_name=bot_info.get("first_name"),
+                                      bot_id=bot_info.get("id"))
                         return
                     else:
-                        logger.error("Telegram API returned error", 
-                                   error=data.get('description', 'Unknown error'))
+                        self._log.error("Telegram API returned error", 
+                                      error=data.get('description', 'Unknown error'))
                 else:
                     # Try to get response text for debugging
                     try:
                         response_text = await response.text()
-                        logger.error("Telegram API HTTP error", 
-                                   status=response.status,
-                                   url=api_url,
-                                   response_text=response_text[:500])  # First 500 chars
+                        self._log.error("Telegram API HTTP error", 
+                                      status=response.status,
+                                      url=api_url,
+                                      response_text=response_text[:500])  # First 500 chars
                     except Exception:
-                        logger.error("Telegram API HTTP error", 
-                                   status=response.status,
-                                   url=api_url)
+                        self._log.error("Telegram API HTTP error", 
+                                      status=response.status,
+                                      url=api_url)
             
         except asyncio.TimeoutError:
-            logger.error("Telegram API connection timeout", 
-                        url=f"{self.base_url}/getMe",
-                        timeout_seconds=10)
+            self._log.error("Telegram API connection timeout", 
+                           url=f"{self.base_url}/getMe",
+                           timeout_seconds=_TIMEOUT_SHORT.total)
         except aiohttp.ClientError as e:
-            logger.error("Telegram API client error", 
-                        error=str(e),
-                        error_type=type(e).__name__)
+            self._log.error("Telegram API client error", 
+                           error=str(e),
+                           error_type=type(e).__name__)
         except Exception as e:
-            logger.error("Unexpected error connecting to Telegram API", 
-                        error=str(e),
-                        error_type=type(e).__name__)
+            self._log.error("Unexpected error connecting to Telegram API", 
+                           error=str(e),
+                           error_type=type(e).__name__)
         
         # Cleanup session on failure
         if self.session:
@@ -130,12 +439,12 @@ class TelegramNotifier:
             self.session = None
             
         self.is_connected = False
-        logger.warning("Telegram notifications will be disabled due to connection failure")
+        self._log.warning("Telegram notifications will be disabled due to connection failure")
         
         # Provide manual testing suggestion
         api_url = f"{self.base_url}/getMe"
-        logger.info("To test the bot token manually, try this curl command:",
-                   curl_command=f'curl -X GET "{api_url}"')
+        self._log.info("To test the bot token manually, try this curl command:",
+                      curl_command=f'curl -X GET "{api_url}"')
     
     def _validate_bot_token(self, token: str) -> bool:
         """Validate Telegram bot token format."""
@@ -162,11 +471,123 @@ class TelegramNotifier:
     
     async def disconnect(self) -> None:
         """Disconnect from Telegram API."""
+        # Refuse new sends first so nothing is queued while the workers drain and stop
+        self.is_connected = False
+        await self._stop_send_workers()
+        
+        # Let background sends finish before the session goes away
+        if self._bg_tasks:
+            await asyncio.wait(set(self._bg_tasks), timeout=SEND_DRAIN_TIMEOUT_SECONDS)
+        
         if self.session:
             await self.session.close()
             self.session = None
-        self.is_connected = False
-        logger.info("Disconnected from Telegram API")
+        self._log.info("Disconnected from Telegram API")
+    
+    def _start_send_workers(self) -> None:
+        """Create the send queue and spawn the worker tasks consuming it."""
+        if self._send_workers:
+            return
+        
+        self._send_queue = asyncio.Queue(maxsize=SEND_QUEUE_MAXSIZE)
+        self._send_workers = [
+            asyncio.create_task(self._send_worker())
+            for _ in range(SEND_WORKER_COUNT)
+        ]
+    
+    async def _stop_send_workers(self) -> None:
+        """Drain pending sends, then cancel the worker tasks."""
+        if not self._send_workers:
+            return
+        
+        try:
+            await asyncio.wait_for(self._send_queue.join(), timeout=SEND_DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            self._log.warning("Timeout draining Telegram send queue",
+                              pending_sends=self._send_queue.qsize())
+        
+        for worker in self._send_workers:
+            worker.cancel()
+        await asyncio.gather(*self._send_workers, return_exceptions=True)
+        self._send_workers = []
+        
+        # Resolve anything still queued so no caller waits forever
+        while not self._send_queue.empty():
+            *_, future = self._send_queue.get_nowait()
+            if not future.done():
+                future.set_result(False)
+        self._send_queue = None
+    
+    async def _send_worker(self) -> None:
+        """Consume queued sends and resolve their futures with the result."""
+        while True:
+            body, chat_id, future = await self._send_queue.get()
+            try:
+                if not future.done():
+                    result = await self._post_message_body(body, chat_id)
+                    if not future.done():
+                        future.set_result(result)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._send_queue.task_done()
+    
+    async def _enqueue_send(self, body: bytes, chat_id: str) -> asyncio.Future:
+        """
+        Queue a pre-encoded sendMessage body for a single chat.
+        
+        Waits while the queue is full. The returned future resolves to the
+        send result once a worker has processed it, or to False if the
+        notifier is disconnecting.
+        """
+        future = asyncio.get_running_loop().create_future()
+        queue = self._send_queue
+        if queue is None or not self.is_connected:
+            future.set_result(False)
+            return future
+        
+        await queue.put((body, chat_id, future))
+        
+        # The put may have been unblocked by the shutdown sweep, after the workers were gone
+        if self._send_queue is not queue and not future.done():
+            future.set_result(False)
+        return future
+    
+    async def _enqueue_message(self, message: str, chat_ids: List[str],
+                               parse_mode: str = "HTML") -> List[asyncio.Future]:
+        """Queue a message for each chat and return the per-chat result futures."""
+        fields = self._encode_message_fields(message, parse_mode)
+        futures = []
+        for chat_id, chat_id_bytes in zip(chat_ids, self._get_chat_id_bytes(chat_ids)):
+            futures.append(await self._enqueue_send(b'{"chat_id":' + chat_id_bytes + fields, chat_id))
+        return futures
+    
+    @staticmethod
+    def _encode_chat_ids(chat_ids: List[str]) -> List[bytes]:
+        """JSON-encode chat IDs to bytes for use in request bodies."""
+        return [orjson.dumps(chat_id) for chat_id in chat_ids]
+    
+    def _get_chat_id_bytes(self, chat_ids: List[str]) -> List[bytes]:
+        """Return encoded chat IDs, reusing the ones precomputed in __init__."""
+        if chat_ids is self.chat_ids:
+            return self._chat_id_bytes
+        if chat_ids is self.retake_chat_ids:
+            return self._retake_chat_id_bytes
+        return self._encode_chat_ids(chat_ids)
+    
+    @staticmethod
+    def _encode_message_fields(message: str, parse_mode: Optional[str] = "HTML") -> bytes:
+        """Encode the chat-independent part of a JSON sendMessage body (after the chat_id member)."""
+        fields = {"text": message}
+        if parse_mode:
+            fields["parse_mode"] = parse_mode
+        fields["disable_web_page_preview"] = True
+        # Swap the opening brace for a separator so the chat_id member can be prepended
+        return b"," + orjson.dumps(fields)[1:]
     
     async def send_message(self, message: str, parse_mode: str = "HTML") -> Dict[str, bool]:
         """
@@ -180,34 +601,31 @@ class TelegramNotifier:
             Dict mapping chat_id to success status
         """
         if not self.is_connected or not self.session:
-            logger.warning("Telegram notifier not connected, cannot send message")
+            self._log.warning("Telegram notifier not connected, cannot send message")
             return {chat_id: False for chat_id in self.chat_ids}
         
         results = {}
         
-        # Send message to all chat IDs concurrently
-        tasks = []
-        for chat_id in self.chat_ids:
-            task = self._send_message_to_chat(message, chat_id, parse_mode)
-            tasks.append(task)
+        # Queue message for all chat IDs
+        futures = await self._enqueue_message(message, self.chat_ids, parse_mode)
         
         # Wait for all sends to complete
-        send_results = await asyncio.gather(*tasks, return_exceptions=True)
+        send_results = await asyncio.gather(*futures, return_exceptions=True)
         
         for i, result in enumerate(send_results):
             chat_id = self.chat_ids[i]
             if isinstance(result, Exception):
-                logger.error("Exception sending message to chat", 
-                           chat_id=chat_id, error=str(result))
+                self._log.error("Exception sending message to chat", 
+                              chat_id=chat_id, error=str(result))
                 results[chat_id] = False
             else:
                 results[chat_id] = result
         
         successful_sends = sum(1 for success in results.values() if success)
-        logger.info("Telegram message send results",
-                   total_chats=len(self.chat_ids),
-                   successful_sends=successful_sends,
-                   failed_sends=len(self.chat_ids) - successful_sends)
+        self._log.info("Telegram message send results",
+                      total_chats=len(self.chat_ids),
+                      successful_sends=successful_sends,
+                      failed_sends=len(self.chat_ids) - successful_sends)
         
         return results
     
@@ -224,41 +642,75 @@ class TelegramNotifier:
             Dict mapping chat_id to success status
         """
         if not self.is_connected or not self.session:
-            logger.warning("Telegram notifier not connected, cannot send message")
+            self._log.warning("Telegram notifier not connected, cannot send message")
             return {chat_id: False for chat_id in target_chat_ids}
         
         if not target_chat_ids:
-            logger.warning("No target chat IDs provided")
+            self._log.warning("No target chat IDs provided")
             return {}
         
         results = {}
         
-        # Send message to all target chat IDs concurrently
-        tasks = []
-        for chat_id in target_chat_ids:
-            task = self._send_message_to_chat(message, chat_id, parse_mode)
-            tasks.append(task)
+        # Queue message for all target chat IDs
+        futures = await self._enqueue_message(message, target_chat_ids, parse_mode)
         
         # Wait for all sends to complete
-        send_results = await asyncio.gather(*tasks, return_exceptions=True)
+        send_results = await asyncio.gather(*futures, return_exceptions=True)
         
         for i, result in enumerate(send_results):
             chat_id = target_chat_ids[i]
             if isinstance(result, Exception):
-                logger.error("Exception sending message to chat", 
-                           chat_id=chat_id, error=str(result))
+                self._log.error("Exception sending message to chat", 
+                              chat_id=chat_id, error=str(result))
                 results[chat_id] = False
             else:
                 results[chat_id] = result
         
         successful_sends = sum(1 for success in results.values() if success)
-        logger.info("Telegram message send results to specific chats",
-                   total_chats=len(target_chat_ids),
-                   successful_sends=successful_sends,
-                   failed_sends=len(target_chat_ids) - successful_sends)
+        self._log.info("Telegram message send results to specific chats",
+                      total_chats=len(target_chat_ids),
+                      successful_sends=successful_sends,
+                      failed_sends=len(target_chat_ids) - successful_sends)
         
         return results
     
+    async def _send_any(self, message: str, target_chat_ids: Optional[List[str]] = None,
+                        parse_mode: str = "HTML") -> bool:
+        """
+        Send a message to chats and return as soon as one send succeeds.
+        
+        Remaining sends stay queued and are completed by the send workers.
+        
+        Args:
+            message: Message text to send
+            target_chat_ids: Target chat IDs (defaults to configured chats)
+            parse_mode: Parse mode (HTML, Markdown, or None)
+        
+        Returns:
+            True if at least one chat received the message successfully
+        """
+        chat_ids = self.chat_ids if target_chat_ids is None else target_chat_ids
+        
+        if not self.is_connected or not self.session:
+            self._log.warning("Telegram notifier not connected, cannot send message")
+            return False
+        
+        if not chat_ids:
+            self._log.warning("No target chat IDs provided")
+            return False
+        
+        futures = await self._enqueue_message(message, chat_ids, parse_mode)
+        
+        for next_done in asyncio.as_completed(futures):
+            try:
+                if await next_done:
+                    return True
+            except Exception as e:
+                self._log.error("Exception sending message to chat", error=str(e))
+        
+        self._log.warning("Telegram message failed for all chats", total_chats=len(chat_ids))
+        return False
+    
     async def _send_message_to_chat(self, message: str, chat_id: str, parse_mode: str = "HTML") -> bool:
         """
         Send a message to a specific chat.
@@ -271,41 +723,48 @@ class TelegramNotifier:
         Returns:
             True if successful, False otherwise
         """
+        chat_id_bytes = self._get_chat_id_bytes([chat_id])[0]
+        body = b'{"chat_id":' + chat_id_bytes + self._encode_message_fields(message, parse_mode)
+        return await self._post_message_body(body, chat_id)
+    
+    async def _post_message_body(self, body: bytes, chat_id: str) -> bool:
+        """
+        POST a pre-encoded sendMessage body.
+        
+        Args:
+            body: JSON-encoded request body
+            chat_id: Target chat ID (for logging)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        log = self._log.bind(chat_id=chat_id)
         try:
-            payload = {
-                "chat_id": chat_id,
-                "text": message,
-                "parse_mode": parse_mode,
-                "disable_web_page_preview": True
-            }
-            
             async with self.session.post(
                 f"{self.base_url}/sendMessage",
-                data=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
+                data=body,
+                headers=_JSON_HEADERS,
+                timeout=_SEND_TIMEOUT
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     if data.get("ok"):
-                        logger.debug("Successfully sent Telegram message", 
-                                   chat_id=chat_id)
+                        log.debug("Successfully sent Telegram message")
                         return True
                     else:
-                        logger.error("Telegram API error", 
-                                   chat_id=chat_id,
-                                   error=data.get("description", "Unknown error"))
+                        log.error("Telegram API error", 
+                                 error=data.get("description", "Unknown error"))
                         return False
                 else:
-                    logger.error("HTTP error sending Telegram message", 
-                               chat_id=chat_id,
-                               status=response.status)
+                    log.error("HTTP error sending Telegram message", 
+                             status=response.status)
                     return False
                     
         except asyncio.TimeoutError:
-            logger.error("Timeout sending Telegram message", chat_id=chat_id)
+            log.error("Timeout sending Telegram message")
             return False
         except Exception as e:
-            logger.error("Error sending Telegram message", chat_id=chat_id, error=str(e))
+            log.error("Error sending Telegram message", error=str(e))
             return False
     
     async def notify_token_created(self, token_info: Dict[str, Any], chain_name: str) -> bool:
@@ -331,9 +790,8 @@ class TelegramNotifier:
             creation_tx_hash = token_info.get("creation_tx_hash", "")
             creation_timestamp = token_info.get("creation_timestamp")
             
-            # Get enhanced display information
+            # Get enhanced display information (creator ENS lookup is awaited below)
             source_display = self._get_source_display_name(source)
-            creator_display = await self._get_creator_display_name(creator_address, chain_id)
             token_link = self._get_token_link(token_address, chain_id)
             zora_profile_link = self._get_zora_profile_link(name, source)
             tx_link = self._get_tx_link(creation_tx_hash, chain_id)
@@ -341,10 +799,10 @@ class TelegramNotifier:
             
             # For Zora tokens, don't send notification if profile link cannot be built
             if source_display == "Zora" and not zora_profile_link:
-                logger.info("Skipping Zora token notification - cannot build profile link", 
-                           token_name=name,
-                           token_address=token_address,
-                           reason="Name contains spaces or invalid characters")
+                self._log.info("Skipping Zora token notification - cannot build profile link", 
+                              token_name=name,
+                              token_address=token_address,
+                              reason="Name contains spaces or invalid characters")
                 return False
             
             # For Zora tokens with valid profile link, fetch enhanced profile data
@@ -353,22 +811,26 @@ class TelegramNotifier:
             if source_display == "Zora" and zora_profile_link:
                 # Extract profile ID from URL
                 profile_id = zora_profile_link.split('@')[1]
-                logger.debug("Fetching Zora profile data", profile_id=profile_id)
+                self._log.debug("Fetching Zora profile data", profile_id=profile_id)
                 
-                profile_data, follow_data = await self._fetch_zora_profile_data(profile_id)
+                # The profile fetch and the creator ENS lookup are independent
+                creator_display, (profile_data, follow_data) = await asyncio.gather(
+                    self._get_creator_display_name(creator_address, chain_id),
+                    self._fetch_zora_profile_data(profile_id)
+                )
                 
-                logger.debug("Zora API call results",
-                           profile_id=profile_id,
-                           profile_data_available=bool(profile_data),
-                           follow_data_available=bool(follow_data),
-                           profile_data_keys=list(profile_data.keys()) if profile_data else None)
+                self._log.debug("Zora API call results",
+                              profile_id=profile_id,
+                              profile_data_available=bool(profile_data),
+                              follow_data_available=bool(follow_data),
+                              profile_data_keys=list(profile_data.keys()) if profile_data else None)
                 
                 # If API call failed, don't send notification
                 if not profile_data:
-                    logger.info("Skipping Zora token notification - failed to fetch profile data",
-                               token_name=name,
-                               token_address=token_address,
-                               profile_id=profile_id)
+                    self._log.info("Skipping Zora token notification - failed to fetch profile data",
+                                  token_name=name,
+                                  token_address=token_address,
+                                  profile_id=profile_id)
                     return False
                 
                 # Check followers count - only notify if followers > 10
@@ -379,17 +841,19 @@ class TelegramNotifier:
                         followers_count = followed_edges.get("count", 0)
                 
                 if followers_count <= 10:
-                    logger.info("Skipping Zora token notification - insufficient followers",
-                               token_name=name,
-                               token_address=token_address,
-                               profile_id=profile_id,
-                               followers_count=followers_count,
-                               minimum_required=11)
+                    self._log.info("Skipping Zora token notification - insufficient followers",
+                                  token_name=name,
+                                  token_address=token_address,
+                                  profile_id=profile_id,
+                                  followers_count=followers_count,
+                                  minimum_required=11)
                     return False
                 
-                logger.debug("Zora token passed followers check",
-                           profile_id=profile_id,
-                           followers_count=followers_count)
+                self._log.debug("Zora token passed followers check",
+                              profile_id=profile_id,
+                              followers_count=followers_count)
+            else:
+                creator_display = await self._get_creator_display_name(creator_address, chain_id)
             
             # Build enhanced message for Zora tokens with profile data (follow_data is optional)
             if source_display == "Zora" and profile_data:
@@ -400,54 +864,58 @@ class TelegramNotifier:
                     block_number, zora_profile_link, profile_data, follow_data_safe, tx_link, relative_time
                 )
             else:
-                # Regular message format
+                # Regular message format (Creator closes the tree unless a profile follows)
+                creator_branch = "├──" if zora_profile_link else "└──"
                 message = f"""🎨 <b>New Token:</b> {name} ({symbol})
 ├── <b>CA:</b> <code>{token_address}</code>
-├── <b>Creator:</b> {creator_display}"""
+{creator_branch} <b>Creator:</b> {creator_display}"""
 
                 # Add Zora profile link if available (for non-enhanced cases)
                 if zora_profile_link:
                     clean_name = zora_profile_link.split('@')[1]
                     message += f"\n└── <b>Profile:</b> <a href=\"{zora_profile_link}\">@{clean_name}</a>"
-                else:
-                    message = message.replace("├── <b>Creator:", "└── <b>Creator:")
-
-                message += f"""
 
-<b>Network:</b> {chain_name} • {source_display} • Block #{block_number}
-<b>Created:</b> {tx_link} • {datetime.utcnow().strftime('%d-%m-%Y %H:%M UTC')} {relative_time}"""
+                message += "\n\n" + _render_message(
+                    "footer",
+                    chain_name=chain_name,
+                    source_label=source_display,
+                    block_number=block_number,
+                    tx_link=tx_link,
+                    created_at=self._now_str(),
+                    relative_time=relative_time
+                )
             
             # Check metadata_uri for notification decision
             metadata_uri_field = token_info.get("metadata_uri", "")
             image_url_field = token_info.get("image_url", "") 
             metadata_uri = metadata_uri_field or image_url_field
             
-            logger.debug("Checking for token metadata URI",
-                       token_address=token_address,
-                       metadata_uri_field=metadata_uri_field,
-                       image_url_field=image_url_field,
-                       final_metadata_uri=metadata_uri,
-                       source=source)
+            if self._debug_enabled:
+                self._log.debug("Checking for token metadata URI",
+                              token_address=token_address,
+                              metadata_uri_field=metadata_uri_field,
+                              image_url_field=image_url_field,
+                              final_metadata_uri=metadata_uri,
+                              source=source)
             
             # Skip notification if no metadata_uri found
-            if not metadata_uri or not (metadata_uri.startswith("ipfs://") or metadata_uri.startswith("https://")):
-                logger.info("Skipping token notification - no valid metadata_uri found",
-                           token_address=token_address,
-                           metadata_uri=metadata_uri,
-                           source=source)
+            if not metadata_uri or not metadata_uri.startswith(_VALID_METADATA_PREFIXES):
+                self._log.info("Skipping token notification - no valid metadata_uri found",
+                              token_address=token_address,
+                              metadata_uri=metadata_uri,
+                              source=source)
                 return False
             
             # Send text message (has valid metadata_uri)
-            logger.debug("Valid metadata_uri found, sending text notification",
-                       token_address=token_address,
-                       metadata_uri=metadata_uri)
-            results = await self.send_message(message)
-            return any(results.values())
+            self._log.debug("Valid metadata_uri found, sending text notification",
+                          token_address=token_address,
+                          metadata_uri=metadata_uri)
+            return await self._send_any(message)
             
         except Exception as e:
-            logger.error("Error formatting token notification", 
-                        token_address=token_info.get("token_address"),
-                        error=str(e))
+            self._log.error("Error formatting token notification", 
+                           token_address=token_info.get("token_address"),
+                           error=str(e))
             return False
     
     async def notify_clanker_token_created(self, token_info: Dict[str, Any], chain_name: str) -> bool:
@@ -473,9 +941,11 @@ class TelegramNotifier:
             creation_tx_hash = token_info.get("creation_tx_hash", "")
             creation_timestamp = token_info.get("creation_timestamp")
             
-            # Get enhanced display information
-            creator_display = await self._get_creator_display_name(creator_address, chain_id)
-            admin_display = await self._get_creator_display_name(admin_address, chain_id)
+            # Get enhanced display information (creator and admin ENS lookups run together)
+            creator_display, admin_display = await asyncio.gather(
+                self._get_creator_display_name(creator_address, chain_id),
+                self._get_creator_display_name(admin_address, chain_id)
+            )
             token_link = self._get_token_link(token_address, chain_id)
             tx_link = self._get_tx_link(creation_tx_hash, chain_id)
             relative_time = self._get_relative_time(creation_timestamp)
@@ -491,83 +961,86 @@ class TelegramNotifier:
             token_metadata = token_info.get("token_metadata", "")
             if token_metadata and len(token_metadata.strip()) > 0:
                 if not additional_metadata:
-                    additional_metadata = token_metadata[:150] + ("..." if len(token_metadata) > 150 else "")
+                    additional_metadata = _trunc(token_metadata, 150)
             
-            # Create formatted message
+            # Optional lines below Admin: Retake stream link, then description (keep readable)
+            tree_items = []
             if is_retake_token:
-                retake_url = retake_info.get("url", "")
-                message = f"""🎬 <b>New Token:</b> {name} ({symbol})
-├── <b>CA:</b> <code>{token_address}</code>
-├── <b>Creator:</b> {creator_display}
-├── <b>Admin:</b> {admin_display}
-└── <b>Stream:</b> <a href=\"{retake_url}\">Watch Live</a>"""
-            else:
-                message = f"""🚀 <b>New Token:</b> {name} ({symbol})
-├── <b>CA:</b> <code>{token_address}</code>
-├── <b>Creator:</b> {creator_display}
-└── <b>Admin:</b> {admin_display}"""
-
-            # Add description if available (keep readable)
+                tree_items.append(f"<b>Stream:</b> <a href=\"{retake_info.get('url', '')}\">Watch Live</a>")
             if additional_metadata:
-                short_desc = additional_metadata[:120] + "..." if len(additional_metadata) > 120 else additional_metadata
-                # Adjust tree structure if we have description
-                if is_retake_token:
-                    message = message.replace("└── <b>Stream:", "├── <b>Stream:")
-                    message += f"\n└── <b>Description:</b> {short_desc}"
-                else:
-                    message = message.replace("└── <b>Admin:", "├── <b>Admin:")
-                    message += f"\n└── <b>Description:</b> {short_desc}"
-
-            message += f"""
-
-<b>Network:</b> {chain_name} • Clanker{" (Retake)" if is_retake_token else ""} • Block #{block_number}
-<b>Created:</b> {tx_link} • {datetime.utcnow().strftime('%d-%m-%Y %H:%M UTC')} {relative_time}"""
+                short_desc = _trunc(additional_metadata, 120)
+                tree_items.append(f"<b>Description:</b> {short_desc}")
+            
+            # Create formatted message
+            message = _render_message(
+                "clanker",
+                icon="🎬" if is_retake_token else "🚀",
+                name=name,
+                symbol=symbol,
+                token_address=token_address,
+                creator_display=creator_display,
+                admin_branch="├──" if tree_items else "└──",
+                admin_display=admin_display,
+                tree_items=_render_tree(tree_items)
+            ) + "\n\n" + _render_message(
+                "footer",
+                chain_name=chain_name,
+                source_label="Clanker (Retake)" if is_retake_token else "Clanker",
+                block_number=block_number,
+                tx_link=tx_link,
+                created_at=self._now_str(),
+                relative_time=relative_time
+            )
             
             # Check metadata_uri for notification decision
             metadata_uri_field = token_info.get("metadata_uri", "")
             image_url_field = token_info.get("image_url", "") 
             metadata_uri = metadata_uri_field or image_url_field
             
-            logger.debug("Checking for metadata URI in token_info",
-                       token_address=token_address,
-                       metadata_uri_field=metadata_uri_field,
-                       image_url_field=image_url_field,
-                       final_metadata_uri=metadata_uri,
-                       available_fields=list(token_info.keys()))
+            if self._debug_enabled:
+                self._log.debug("Checking for metadata URI in token_info",
+                              token_address=token_address,
+                              metadata_uri_field=metadata_uri_field,
+                              image_url_field=image_url_field,
+                              final_metadata_uri=metadata_uri,
+                              available_fields=list(token_info.keys()))
             
             # Skip notification if no metadata_uri found
-            if not metadata_uri or not (metadata_uri.startswith("ipfs://") or metadata_uri.startswith("https://")):
-                logger.info("Skipping Clanker token notification - no valid metadata_uri found",
-                           token_address=token_address,
-                           metadata_uri=metadata_uri,
-                           is_retake_token=is_retake_token)
+            if not metadata_uri or not metadata_uri.startswith(_VALID_METADATA_PREFIXES):
+                self._log.info("Skipping Clanker token notification - no valid metadata_uri found",
+                              token_address=token_address,
+                              metadata_uri=metadata_uri,
+                              is_retake_token=is_retake_token)
                 return False
             
             # Send text message (has valid metadata_uri)
-            logger.debug("Valid metadata_uri found, sending Clanker text notification",
-                       token_address=token_address,
-                       metadata_uri=metadata_uri)
-            results = await self.send_message(message)
-            regular_success = any(results.values())
-            
-            # Send special Retake notification if applicable
-            retake_success = False
+            self._log.debug("Valid metadata_uri found, sending Clanker text notification",
+                          token_address=token_address,
+                          metadata_uri=metadata_uri)
             if is_retake_token:
-                retake_success = await self.notify_retake_token_created(token_info, chain_name, retake_info)
+                # Regular and Retake sends share the bounded send queue, so
+                # issue them together instead of one after the other
+                regular_success, retake_success = await asyncio.gather(
+                    self._send_any(message),
+                    self.notify_retake_token_created(token_info, chain_name, retake_info)
+                )
+            else:
+                regular_success = await self._send_any(message)
+                retake_success = False
             
-            logger.info("Clanker token notification results",
-                       token_address=token_address,
-                       is_retake_token=is_retake_token,
-                       notification_success=regular_success,
-                       retake_notification_success=retake_success,
-                       metadata_uri=metadata_uri)
+            self._log.info("Clanker token notification results",
+                          token_address=token_address,
+                          is_retake_token=is_retake_token,
+                          notification_success=regular_success,
+                          retake_notification_success=retake_success,
+                          metadata_uri=metadata_uri)
             
             return regular_success or retake_success  # Return True if at least one send was successful
             
         except Exception as e:
-            logger.error("Error formatting Clanker token notification", 
-                        token_address=token_info.get("token_address"),
-                        error=str(e))
+            self._log.error("Error formatting Clanker token notification", 
+                           token_address=token_info.get("token_address"),
+                           error=str(e))
             return False
     
     async def notify_retake_token_created(self, token_info: Dict[str, Any], chain_name: str, retake_info: Dict[str, Any]) -> bool:
@@ -583,7 +1056,7 @@ class TelegramNotifier:
             True if at least one chat received the message successfully
         """
         if not self.retake_chat_ids:
-            logger.debug("No Retake chat IDs configured, skipping Retake notification")
+            self._log.debug("No Retake chat IDs configured, skipping Retake notification")
             return False
         
         try:
@@ -598,28 +1071,28 @@ class TelegramNotifier:
             creation_tx_hash = token_info.get("creation_tx_hash", "")
             creation_timestamp = token_info.get("creation_timestamp")
             
-            # Get enhanced display information
-            creator_display = await self._get_creator_display_name(creator_address, chain_id)
-            admin_display = await self._get_creator_display_name(admin_address, chain_id)
-            tx_link = self._get_tx_link(creation_tx_hash, chain_id)
-            relative_time = self._get_relative_time(creation_timestamp)
-            
             # Extract Retake information
             retake_url = retake_info.get("url", "")
             description = retake_info.get("description", "")
             
+            # Farcaster data (looked up by token name) is only needed if a Farcaster link is listed
+            has_farcaster = any(
+                isinstance(social_entry, dict)
+                and social_entry.get("platform", "").strip().lower() == "farcaster"
+                for social_entry in retake_info.get("all_social_urls", [])
+            )
+            
+            # ENS lookups and the Farcaster fetch are independent, so run them together
+            creator_display, admin_display, farcaster_data = await asyncio.gather(
+                self._get_creator_display_name(creator_address, chain_id),
+                self._get_creator_display_name(admin_address, chain_id),
+                self._fetch_farcaster_user_data(name) if has_farcaster else _resolved(None)
+            )
+            tx_link = self._get_tx_link(creation_tx_hash, chain_id)
+            relative_time = self._get_relative_time(creation_timestamp)
+            
             # Build social links with enhanced Farcaster support
             social_sections = []
-            farcaster_data = None
-            
-            # First pass: check for Farcaster and fetch data
-            for social_entry in retake_info.get("all_social_urls", []):
-                if isinstance(social_entry, dict):
-                    platform = social_entry.get("platform", "").strip()
-                    if platform.lower() == "farcaster":
-                        # Fetch Farcaster data using token name as username
-                        farcaster_data = await self._fetch_farcaster_user_data(name)
-                        break
             
             # Build social links
             for social_entry in retake_info.get("all_social_urls", []):
@@ -646,92 +1119,75 @@ class TelegramNotifier:
                             social_sections.append(f"{platform}: <a href=\"{url}\">{name}</a>")
             
             # Format social sections with proper tree structure
-            if social_sections:
-                if len(social_sections) == 1:
-                    social_links = social_sections[0]
-                else:
-                    social_links = "\n      ├── " + social_sections[0]
-                    for i in range(1, len(social_sections)):
-                        if i == len(social_sections) - 1:  # Last item
-                            social_links += f"\n      └── {social_sections[i]}"
-                        else:
-                            social_links += f"\n      ├── {social_sections[i]}"
-            else:
-                social_links = "—"
+            social_links = _render_tree(social_sections, _SOCIAL_TREE_INDENT) if social_sections else "—"
             
-            # Create formatted message for Retake
-            short_desc = description[:100] + "..." if len(description) > 100 else description
-            message = f"""🎬 <b>Retake Token:</b> {name} ({symbol})
-├── <b>CA:</b> <code>{token_address}</code>
-├── <b>Creator:</b> {creator_display}
-├── <b>Admin:</b> {admin_display}
-└── <b>Stream:</b> <a href=\"{retake_url}\">Watch Live</a>"""
-
-            # Add optional fields with proper tree structure
+            # Optional fields rendered below the Stream line
+            short_desc = _trunc(description, 100)
             tree_items = []
             if short_desc:
                 tree_items.append(f"<b>Description:</b> {short_desc}")
             if social_links != "—":
-                if "\n" in social_links:  # Multi-line social format
-                    tree_items.append(f"<b>Social:</b>{social_links}")
-                else:  # Single line social format
-                    tree_items.append(f"<b>Social:</b>\n      └── {social_links}")
-                
-            if tree_items:
-                # Replace last └── with ├── and add new items
-                message = message.replace("└── <b>Stream:", "├── <b>Stream:")
-                for i, item in enumerate(tree_items):
-                    if i == len(tree_items) - 1:  # Last item
-                        message += f"\n└── {item}"
-                    else:
-                        message += f"\n├── {item}"
-
-            message += f"""
-
-<b>Network:</b> {chain_name} • Clanker (Retake) • Block #{block_number}
-<b>Created:</b> {tx_link} • {datetime.utcnow().strftime('%d-%m-%Y %H:%M UTC')} {relative_time}"""
+                tree_items.append(f"<b>Social:</b>{social_links}")
+            
+            message = _render_message(
+                "retake",
+                name=name,
+                symbol=symbol,
+                token_address=token_address,
+                creator_display=creator_display,
+                admin_display=admin_display,
+                stream_branch="├──" if tree_items else "└──",
+                retake_url=retake_url,
+                tree_items=_render_tree(tree_items),
+                chain_name=chain_name,
+                block_number=block_number,
+                tx_link=tx_link,
+                created_at=self._now_str(),
+                relative_time=relative_time
+            )
             
             # Check metadata_uri for Retake notification decision
             metadata_uri_field = token_info.get("metadata_uri", "")
             image_url_field = token_info.get("image_url", "")
             metadata_uri = metadata_uri_field or image_url_field
             
-            logger.debug("Checking for metadata URI in Retake token_info",
-                       token_address=token_address,
-                       metadata_uri_field=metadata_uri_field,
-                       image_url_field=image_url_field,
-                       final_metadata_uri=metadata_uri,
-                       available_fields=list(token_info.keys()))
+            if self._debug_enabled:
+                self._log.debug("Checking for metadata URI in Retake token_info",
+                              token_address=token_address,
+                              metadata_uri_field=metadata_uri_field,
+                              image_url_field=image_url_field,
+                              final_metadata_uri=metadata_uri,
+                              available_fields=list(token_info.keys()))
             
             # Skip Retake notification if no metadata_uri found
-            if not metadata_uri or not (metadata_uri.startswith("ipfs://") or metadata_uri.startswith("https://")):
-                logger.info("Skipping Retake token notification - no valid metadata_uri found",
-                           token_address=token_address,
-                           metadata_uri=metadata_uri,
-                           retake_url=retake_url)
+            if not metadata_uri or not metadata_uri.startswith(_VALID_METADATA_PREFIXES):
+                self._log.info("Skipping Retake token notification - no valid metadata_uri found",
+                              token_address=token_address,
+                              metadata_uri=metadata_uri,
+                              retake_url=retake_url)
                 return False
             
             # Send text message to Retake channels (has valid metadata_uri)
-            logger.debug("Valid metadata_uri found, sending Retake text notification",
-                       token_address=token_address,
-                       metadata_uri=metadata_uri)
+            self._log.debug("Valid metadata_uri found, sending Retake text notification",
+                          token_address=token_address,
+                          metadata_uri=metadata_uri)
             results = await self.send_message_to_chats(message, self.retake_chat_ids)
             success = any(results.values())
             
-            logger.info("Retake token notification sent",
-                       token_address=token_address,
-                       retake_url=retake_url,
-                       notification_success=success,
-                       total_retake_channels=len(self.retake_chat_ids),
-                       metadata_uri=metadata_uri)
+            self._log.info("Retake token notification sent",
+                          token_address=token_address,
+                          retake_url=retake_url,
+                          notification_success=success,
+                          total_retake_channels=len(self.retake_chat_ids),
+                          metadata_uri=metadata_uri)
             
             return success
             
         except Exception as e:
-            logger.error("Error formatting Retake token notification", 
-                        token_address=token_info.get("token_address"),
-                        retake_url=retake_info.get("url", ""),
-                        error=str(e))
+            self._log.error("Error formatting Retake token notification", 
+                           token_address=token_info.get("token_address"),
+                           retake_url=retake_info.get("url", ""),
+                           error=str(e))
             return False
     
     async def health_check(self) -> bool:
@@ -742,15 +1198,15 @@ class TelegramNotifier:
         try:
             async with self.session.get(
                 f"{self.base_url}/getMe",
-                timeout=aiohttp.ClientTimeout(total=10)
+                timeout=_TIMEOUT_SHORT
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     return data.get("ok", False)
                 return False
                 
         except Exception as e:
-            logger.error("Telegram health check failed", error=str(e))
+            self._log.error("Telegram health check failed", error=str(e))
             return False
     
     def _get_source_display_name(self, source: str) -> str:
@@ -763,12 +1219,7 @@ class TelegramNotifier:
         Returns:
             Display name ('Clanker' for clanker, 'Zora' for others)
         """
-        source_lower = source.lower().strip()
-        
-        if 'clanker' in source_lower:
-            return 'Clanker'
-        else:
-            return 'Zora'
+        return _source_display_name(source)
     
     async def _get_creator_display_name(self, address: str, chain_id: int = 1) -> str:
         """
@@ -781,7 +1232,7 @@ class TelegramNotifier:
         Returns:
             ENS name with address link, or just address link if no ENS
         """
-        if not address or not Web3.is_address(address):
+        if not address or not _is_address_fast(address):
             return address or "Unknown"
         
         # Always get the clickable address link (use short format for better display)
@@ -789,18 +1240,48 @@ class TelegramNotifier:
         
         # Try to get ENS name
         if self.ens_resolver:
-            try:
-                ens_result = await self.ens_resolver.resolve_and_format(address, prefer_base=True)
-                # Check if ENS resolution returned something different than just the address
-                if ens_result and not ens_result.startswith('<code>') and ens_result != address:
-                    # We have an ENS name, show: ENS_NAME (short_address_link)
-                    return f"{ens_result} ({address_link})"
-            except Exception as e:
-                logger.debug("Failed to resolve ENS", address=address, error=str(e))
+            ens_name = await self._resolve_ens_cached(address)
+            if ens_name:
+                # We have an ENS name, show: ENS_NAME (short_address_link)
+                return f"{ens_name} ({address_link})"
         
         # Fallback to just the clickable address link (short format)
         return address_link
     
+    async def _resolve_ens_cached(self, address: str) -> Optional[str]:
+        """
+        Resolve ENS name for an address, reusing recent hits and misses.
+        
+        Args:
+            address: Ethereum address
+            
+        Returns:
+            ENS name if found, None otherwise
+        """
+        key = address.lower()
+        now = time.monotonic()
+        entry = self._ens_cache.get(key)
+        if entry and now < entry[0]:
+            return entry[1]
+        
+        try:
+            ens_result = await self.ens_resolver.resolve_and_format(address, prefer_base=True)
+        except Exception as e:
+            # Transient failures are not cached
+            self._log.debug("Failed to resolve ENS", address=address, error=str(e))
+            return None
+        
+        # Check if ENS resolution returned something different than just the address
+        if ens_result and not ens_result.startswith('<code>') and ens_result != address:
+            ens_name, ttl = ens_result, _ENS_CACHE_TTL_SECONDS
+        else:
+            ens_name, ttl = None, _ENS_NEGATIVE_CACHE_TTL_SECONDS
+        
+        if len(self._ens_cache) >= _ENS_CACHE_MAXSIZE:
+            self._ens_cache.clear()
+        self._ens_cache[key] = (now + ttl, ens_name)
+        return ens_name
+    
     def _get_address_link(self, address: str, chain_id: int, short_format: bool = False) -> str:
         """
         Get clickable link for address.
@@ -818,11 +1299,11 @@ class TelegramNotifier:
         
         # Format address display
         if short_format and len(address) > 10:
-            display_address = f"{address[:5]}...{address[-4:]}"
+            display_address = _shorten_address(address)
         else:
             display_address = address
         
-        explorer_url = self.block_explorer.get_address_url(chain_id, address)
+        explorer_url = self._address_url(chain_id, address)
         if explorer_url:
             return f'<a href="{explorer_url}">{display_address}</a>'
         else:
@@ -842,7 +1323,7 @@ class TelegramNotifier:
         if not address:
             return "Unknown"
         
-        token_url = self.block_explorer.get_token_url(chain_id, address)
+        token_url = self._token_url(chain_id, address)
         if token_url:
             return f'<a href="{token_url}">{address}</a>'
         else:
@@ -862,7 +1343,7 @@ class TelegramNotifier:
         if not tx_hash:
             return "N/A"
         
-        tx_url = self.block_explorer.get_transaction_url(chain_id, tx_hash)
+        tx_url = self._tx_url(chain_id, tx_hash)
         if tx_url:
             return f'<a href="{tx_url}">Scan</a>'
         else:
@@ -879,20 +1360,7 @@ class TelegramNotifier:
         Returns:
             Zora profile URL or None if not applicable
         """
-        source_display = self._get_source_display_name(source)
-        
-        # Only create Zora profile links for non-Clanker tokens
-        if source_display == "Zora" and token_name and token_name != "Unknown":
-            # Don't create profile link if name contains spaces
-            if ' ' in token_name:
-                return None
-            
-            # Clean token name for URL (remove special chars, convert to lowercase)
-            clean_name = token_name.lower().replace('-', '').replace('_', '')
-            if clean_name and clean_name.isalnum():  # Only alphanumeric characters
-                return f"https://zora.co/@{clean_name}"
-        
-        return None
+        return _zora_profile_link(token_name, source)
     
     async def _fetch_zora_profile_data(self, profile_id: str) -> Tuple[Optional[Dict], Optional[Dict]]:
         """
@@ -905,106 +1373,83 @@ class TelegramNotifier:
             Tuple of (profile_data, follow_data) or (None, None) if failed
         """
         if not self.session:
-            logger.warning("No HTTP session available for Zora API call")
+            self._log.warning("No HTTP session available for Zora API call")
             return None, None
         
         try:
             zora_api_url = "https://api.zora.co/universal/graphql"
             
-            # First API call - Profile data
+            # Profile data query
             profile_payload = {
                 "hash": "2235344f44551e5c5eee3e04c46465c7",
                 "variables": {"profileId": profile_id},
                 "operationName": "UserProfileWebQuery"
             }
             
-            # Second API call - Follow data  
+            # Follow data query
             follow_payload = {
                 "hash": "c7c7fb2ef84bae095076863db797dcf8",
                 "variables": {"profileId": profile_id}, 
                 "operationName": "FollowInformationWebQuery"
             }
             
-            # Make both API calls concurrently
-            profile_task = self.session.post(
-                zora_api_url,
-                json=profile_payload,
-                timeout=aiohttp.ClientTimeout(total=15)
-            )
+            profile_data = None
+            follow_data = None
             
-            follow_task = self.session.post(
+            # Send both queries as one batched GraphQL request
+            async with self.session.post(
                 zora_api_url,
-                json=follow_payload,
-                timeout=aiohttp.ClientTimeout(total=15)
-            )
-            
-            profile_response, follow_response = await asyncio.gather(
-                profile_task, follow_task, return_exceptions=True
-            )
+                json=[profile_payload, follow_payload],
+                timeout=_TIMEOUT_LONG
+            ) as response:
+                if response.status != 200:
+                    self._log.warning("Zora API HTTP error", 
+                                    profile_id=profile_id, 
+                                    status=response.status)
+                    return None, None
+                
+                batch_json = orjson.loads(await response.read())
             
-            profile_data = None
-            follow_data = None
+            if not isinstance(batch_json, list) or len(batch_json) != 2:
+                self._log.warning("Unexpected Zora batch response",
+                                profile_id=profile_id,
+                                response_type=type(batch_json).__name__)
+                return None, None
             
-            # Parse profile response
-            if not isinstance(profile_response, Exception):
-                if profile_response.status == 200:
-                    try:
-                        profile_json = await profile_response.json()
-                        data_section = profile_json.get("data") if profile_json else None
-                        profile_data = data_section.get("profile") if data_section else None
-                        
-                        logger.debug("Profile API success", 
-                                   profile_id=profile_id,
-                                   has_profile=bool(profile_data),
-                                   profile_json_keys=list(profile_json.keys()) if profile_json else None,
-                                   data_keys=list(data_section.keys()) if data_section else None,
-                                   profile_type=type(profile_data).__name__ if profile_data else None)
-                    except Exception as e:
-                        logger.warning("Failed to parse profile response", 
-                                     profile_id=profile_id, error=str(e))
-                else:
-                    logger.warning("Profile API HTTP error", 
-                                 profile_id=profile_id, 
-                                 status=profile_response.status)
-            else:
-                logger.warning("Profile API request failed", 
-                             profile_id=profile_id, 
-                             error=str(profile_response))
+            profile_json, follow_json = batch_json
             
-            # Parse follow response
-            if not isinstance(follow_response, Exception):
-                if follow_response.status == 200:
-                    try:
-                        follow_json = await follow_response.json()
-                        follow_data = follow_json.get("data", {}).get("profile")
-                        logger.debug("Follow API success", 
-                                   profile_id=profile_id,
-                                   has_follow_data=bool(follow_data))
-                    except Exception as e:
-                        logger.warning("Failed to parse follow response", 
-                                     profile_id=profile_id, error=str(e))
-                else:
-                    logger.warning("Follow API HTTP error", 
-                                 profile_id=profile_id, 
-                                 status=follow_response.status)
-            else:
-                logger.warning("Follow API request failed", 
-                             profile_id=profile_id, 
-                             error=str(follow_response))
+            # Parse profile result
+            try:
+                data_section = profile_json.get("data") if profile_json else None
+                profile_data = data_section.get("profile") if data_section else None
+                
+                self._log.debug("Profile API success", 
+                              profile_id=profile_id,
+                              has_profile=bool(profile_data),
+                              profile_json_keys=list(profile_json.keys()) if profile_json else None,
+                              data_keys=list(data_section.keys()) if data_section else None,
+                              profile_type=type(profile_data).__name__ if profile_data else None)
+            except Exception as e:
+                self._log.warning("Failed to parse profile response", 
+                                profile_id=profile_id, error=str(e))
             
-            # Close responses
-            if not isinstance(profile_response, Exception):
-                profile_response.close()
-            if not isinstance(follow_response, Exception):
-                follow_response.close()
+            # Parse follow result
+            try:
+                follow_data = follow_json.get("data", {}).get("profile")
+                self._log.debug("Follow API success", 
+                              profile_id=profile_id,
+                              has_follow_data=bool(follow_data))
+            except Exception as e:
+                self._log.warning("Failed to parse follow response", 
+                                profile_id=profile_id, error=str(e))
             
             return profile_data, follow_data
             
         except Exception as e:
-            logger.warning("Failed to fetch Zora profile data", 
-                          profile_id=profile_id, 
-                          error=str(e),
-                          error_type=type(e).__name__)
+            self._log.warning("Failed to fetch Zora profile data", 
+                             profile_id=profile_id, 
+                             error=str(e),
+                             error_type=type(e).__name__)
             return None, None
     
     def _extract_retake_info(self, token_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -1044,41 +1489,42 @@ class TelegramNotifier:
             if metadata_json and isinstance(metadata_json, dict):
                 retake_info = _check_social_urls_for_retake(metadata_json)
                 if retake_info:
-                    logger.debug("Found Retake info from metadata_json")
+                    self._log.debug("Found Retake info from metadata_json")
                     return retake_info
             
             # 2. Try token_metadata as JSON string (root level)
             token_metadata = token_info.get("token_metadata", "")
             if token_metadata and isinstance(token_metadata, str) and len(token_metadata.strip()) > 0:
-                try:
-                    parsed_metadata = json.loads(token_metadata)
-                    if isinstance(parsed_metadata, dict):
-                        retake_info = _check_social_urls_for_retake(parsed_metadata)
-                        if retake_info:
-                            logger.debug("Found Retake info from token_metadata")
-                            return retake_info
-                except json.JSONDecodeError:
-                    logger.debug("Failed to parse token_metadata as JSON for Retake info")
+                parsed_metadata = _parse_metadata_json(token_metadata)
+                if parsed_metadata is not None:
+                    retake_info = _check_social_urls_for_retake(parsed_metadata)
+                    if retake_info:
+                        self._log.debug("Found Retake info from token_metadata")
+                        return retake_info
+                else:
+                    self._log.debug("Failed to parse token_metadata as JSON for Retake info")
             
             # 3. Try raw_event_data.token_metadata (nested path)
             raw_event_data = token_info.get("raw_event_data", {})
             if isinstance(raw_event_data, dict):
                 raw_token_metadata = raw_event_data.get("token_metadata", "")
-                if raw_token_metadata and isinstance(raw_token_metadata, str) and len(raw_token_metadata.strip()) > 0:
-                    try:
-                        parsed_metadata = json.loads(raw_token_metadata)
-                        if isinstance(parsed_metadata, dict):
-                            retake_info = _check_social_urls_for_retake(parsed_metadata)
-                            if retake_info:
-                                logger.debug("Found Retake info from raw_event_data.token_metadata")
-                                return retake_info
-                    except json.JSONDecodeError:
-                        logger.debug("Failed to parse raw_event_data.token_metadata as JSON for Retake info")
+                # Skip if it is the payload already checked in step 2
+                if (raw_token_metadata and isinstance(raw_token_metadata, str)
+                        and raw_token_metadata != token_metadata
+                        and len(raw_token_metadata.strip()) > 0):
+                    parsed_metadata = _parse_metadata_json(raw_token_metadata)
+                    if parsed_metadata is not None:
+                        retake_info = _check_social_urls_for_retake(parsed_metadata)
+                        if retake_info:
+                            self._log.debug("Found Retake info from raw_event_data.token_metadata")
+                            return retake_info
+                    else:
+                        self._log.debug("Failed to parse raw_event_data.token_metadata as JSON for Retake info")
             
             return None
             
         except (AttributeError, TypeError) as e:
-            logger.debug("Failed to extract Retake info", error=str(e))
+            self._log.debug("Failed to extract Retake info", error=str(e))
             return None
     
     def _get_relative_time(self, creation_timestamp) -> str:
@@ -1095,31 +1541,19 @@ class TelegramNotifier:
             if creation_timestamp is None:
                 return ""
             
-            # Handle different timestamp formats
-            if isinstance(creation_timestamp, str):
-                # Try parsing ISO format first
-                try:
-                    creation_time = datetime.fromisoformat(creation_timestamp.replace('Z', '+00:00'))
-                except:
-                    return ""
-            elif isinstance(creation_timestamp, (int, float)):
-                # Unix timestamp
-                creation_time = datetime.fromtimestamp(creation_timestamp)
+            # Normalize to a Unix timestamp (naive datetimes are UTC)
+            if isinstance(creation_timestamp, (int, float)):
+                created_at = creation_timestamp
             elif isinstance(creation_timestamp, datetime):
-                creation_time = creation_timestamp
+                created_at = _datetime_to_unix(creation_timestamp)
+            elif isinstance(creation_timestamp, str):
+                created_at = _parse_iso_timestamp(creation_timestamp)
+                if created_at is None:
+                    return ""
             else:
                 return ""
             
-            # Calculate time difference
-            now = datetime.utcnow()
-            if creation_time.tzinfo is not None:
-                # If creation_time has timezone info, make now timezone aware
-                from datetime import timezone
-                now = now.replace(tzinfo=timezone.utc)
-                
-            diff = now - creation_time
-            
-            total_seconds = int(diff.total_seconds())
+            total_seconds = int(time.time() - created_at)
             
             if total_seconds < 60:
                 return f"({total_seconds}s ago)"
@@ -1134,23 +1568,20 @@ class TelegramNotifier:
                 return f"({days}d ago)"
                 
         except Exception as e:
-            logger.debug("Error calculating relative time", error=str(e))
+            self._log.debug("Error calculating relative time", error=str(e))
             return ""
     
     def _format_number_compact(self, value: str) -> str:
         """Format large numbers in compact form (K, M, B)."""
         try:
             num = float(value)
-            if num >= 1_000_000_000:
-                return f"{num/1_000_000_000:.1f}B"
-            elif num >= 1_000_000:
-                return f"{num/1_000_000:.1f}M"
-            elif num >= 1_000:
-                return f"{num/1_000:.1f}K"
-            else:
-                return f"{num:.1f}"
         except (ValueError, TypeError):
             return value
+        
+        for threshold, divisor, suffix in _COMPACT_UNITS:
+            if num >= threshold:
+                return f"{num / divisor:.1f}{suffix}"
+        return f"{num:.1f}"
     
     def _safe_format_int(self, value) -> str:
         """Safely format value as integer with comma separator."""
@@ -1163,29 +1594,13 @@ class TelegramNotifier:
         """Build social media links string."""
         links = []
         
-        # Check Twitter/X (field can be None)
-        twitter = social_accounts.get("twitter")
-        if twitter and isinstance(twitter, dict) and twitter.get("username"):
-            username = twitter["username"]
-            links.append(f"<a href=\"https://x.com/{username}\">𝕏</a>")
-        
-        # Check Farcaster (field can be None)
-        farcaster = social_accounts.get("farcaster")
-        if farcaster and isinstance(farcaster, dict) and farcaster.get("username"):
-            username = farcaster["username"]
-            links.append(f"<a href=\"https://farcaster.xyz/{username}\">🟣</a>")
-        
-        # Check Instagram (field can be None)
-        instagram = social_accounts.get("instagram")
-        if instagram and isinstance(instagram, dict) and instagram.get("username"):
-            username = instagram["username"]
-            links.append(f"<a href=\"https://instagram.com/{username}\">📷</a>")
-        
-        # Check TikTok (field can be None)
-        tiktok = social_accounts.get("tiktok")
-        if tiktok and isinstance(tiktok, dict) and tiktok.get("username"):
-            username = tiktok["username"]
-            links.append(f"<a href=\"https://tiktok.com/@{username}\">🎵</a>")
+        # Each account field can be None or missing
+        for key, url_prefix, label in _SOCIAL_SPECS:
+            account = social_accounts.get(key)
+            if isinstance(account, dict):
+                username = account.get("username")
+                if username:
+                    links.append(f"<a href=\"{url_prefix}{username}\">{label}</a>")
         
         return " ".join(links) if links else "—"
     
@@ -1195,6 +1610,9 @@ class TelegramNotifier:
         profile_data: Dict, follow_data: Dict, tx_link: str, relative_time: str = ""
     ) -> str:
         """Build enhanced Zora message with profile data."""
+        # Shared by the enhanced and fallback paths
+        created_at = self._now_str()
+        clean_name = zora_profile_link.rsplit('@', 1)[-1] if '@' in zora_profile_link else name.lower()
         
         try:
             # Validate input data
@@ -1202,10 +1620,11 @@ class TelegramNotifier:
                 raise ValueError(f"Invalid profile_data: {type(profile_data)}")
             
             # Log profile data structure for debugging
-            logger.debug("Processing profile data", 
-                        profile_id=zora_profile_link.split('@')[1] if '@' in zora_profile_link else "unknown",
-                        profile_data_keys=list(profile_data.keys()),
-                        profile_data_type=type(profile_data).__name__)
+            if self._debug_enabled:
+                self._log.debug("Processing profile data", 
+                               profile_id=clean_name,
+                               profile_data_keys=list(profile_data.keys()),
+                               profile_data_type=type(profile_data).__name__)
             
             # Extract profile information with safe defaults
             try:
@@ -1213,9 +1632,10 @@ class TelegramNotifier:
                 bio = profile_data.get("bio") or ""
                 is_unverified = profile_data.get("isUnverifiedCreator", False)
                 blocked = profile_data.get("blocked", False)
-                logger.debug("Basic profile info extracted", display_name=display_name[:20] + "..." if len(display_name) > 20 else display_name)
+                if self._debug_enabled:
+                    self._log.debug("Basic profile info extracted", display_name=_trunc(display_name, 20))
             except Exception as e:
-                logger.warning("Error extracting basic profile info", error=str(e))
+                self._log.warning("Error extracting basic profile info", error=str(e))
                 display_name = name
                 bio = ""
                 is_unverified = False
@@ -1226,31 +1646,31 @@ class TelegramNotifier:
                 external_wallet = profile_data.get("externalWallet") or {}
                 ens_name = external_wallet.get("ensName") if external_wallet else None
                 wallet_address = external_wallet.get("walletAddress", "Unknown") if external_wallet else "Unknown"
-                logger.debug("Wallet info extracted", has_ens=bool(ens_name), wallet_address=wallet_address[:10] + "..." if wallet_address != "Unknown" else "Unknown")
+                if self._debug_enabled:
+                    self._log.debug("Wallet info extracted", has_ens=bool(ens_name), wallet_address=wallet_address[:10] + "..." if wallet_address != "Unknown" else "Unknown")
             except Exception as e:
-                logger.warning("Error extracting wallet info", error=str(e))
+                self._log.warning("Error extracting wallet info", error=str(e))
                 ens_name = None
                 wallet_address = "Unknown"
             
             # Build wallet display
             try:
+                explorer_url = self._address_url(8453, wallet_address) if self.block_explorer else "#"
                 if ens_name:
-                    explorer_url = self.block_explorer.get_address_url(8453, wallet_address) if self.block_explorer else "#"
                     wallet_display = f"{ens_name} (<a href=\"{explorer_url}\">{wallet_address}</a>)"
                 else:
-                    explorer_url = self.block_explorer.get_address_url(8453, wallet_address) if self.block_explorer else "#"
                     wallet_display = f"<a href=\"{explorer_url}\">{wallet_address}</a>"
             except Exception as e:
-                logger.debug("Error building wallet display", error=str(e), wallet_address=wallet_address)
+                self._log.debug("Error building wallet display", error=str(e), wallet_address=wallet_address)
                 wallet_display = wallet_address
             
             # Social accounts (can be None)
             try:
                 social_accounts = profile_data.get("socialAccounts") or {}
                 social_links = self._build_social_links(social_accounts)
-                logger.debug("Social accounts processed", social_links=social_links)
+                self._log.debug("Social accounts processed", social_links=social_links)
             except Exception as e:
-                logger.warning("Error processing social accounts", error=str(e))
+                self._log.warning("Error processing social accounts", error=str(e))
                 social_links = "—"
             
             # Token stats (creatorCoin can be None)
@@ -1261,9 +1681,9 @@ class TelegramNotifier:
                 market_cap = self._format_number_compact(creator_coin.get("marketCap", "0")) if creator_coin else "0"
                 market_cap_delta = creator_coin.get("marketCapDelta24h", "0") if creator_coin else "0"
                 unique_holders = creator_coin.get("uniqueHolders", "0") if creator_coin else "0"
-                logger.debug("Token stats extracted", market_cap=market_cap, volume_24h=volume_24h)
+                self._log.debug("Token stats extracted", market_cap=market_cap, volume_24h=volume_24h)
             except Exception as e:
-                logger.warning("Error extracting token stats", error=str(e))
+                self._log.warning("Error extracting token stats", error=str(e))
                 volume_24h = total_volume = market_cap = market_cap_delta = unique_holders = "0"
             
             # Format market cap change
@@ -1286,9 +1706,9 @@ class TelegramNotifier:
                     mutual_followers = followers_in_vc.get("count", 0) if isinstance(followers_in_vc, dict) else 0
                 else:
                     followers = following = mutual_followers = 0
-                logger.debug("Follow stats extracted", followers=followers, following=following, mutual=mutual_followers)
+                self._log.debug("Follow stats extracted", followers=followers, following=following, mutual=mutual_followers)
             except Exception as e:
-                logger.warning("Error extracting follow stats", error=str(e))
+                self._log.warning("Error extracting follow stats", error=str(e))
                 followers = following = mutual_followers = 0
             
             # Status emojis
@@ -1297,66 +1717,82 @@ class TelegramNotifier:
             
             # Build enhanced message
             try:
-                clean_name = zora_profile_link.split('@')[1] if '@' in zora_profile_link else name.lower()
-                
-                # Build enhanced message with all info using tree structure
-                message = f"""🎨 <b>Zora Token:</b> {display_name} ({symbol})
-├── <b>CA:</b> <code>{token_address}</code>
-├── <b>Creator:</b> {creator_display}
-├── <b>Profile:</b> <a href=\"{zora_profile_link}\">@{clean_name}</a> {verified_emoji}
-├── <b>Stats:</b>
-│   ├── Market Cap: ${market_cap} ({delta_formatted})
-│   ├── 24h Vol: ${volume_24h} • Total: ${total_volume}
-│   ├── Holders: {self._safe_format_int(unique_holders)}
-│   └── Followers: {self._safe_format_int(followers)} • Following: {self._safe_format_int(following)}"""
-
-                # Add optional fields with proper tree structure
+                # Optional fields below Stats
                 tree_items = []
                 if bio:
-                    bio_short = bio[:80] + "..." if len(bio) > 80 else bio
+                    bio_short = _trunc(bio, 80)
                     tree_items.append(f"<b>Bio:</b> {bio_short}")
                 if social_links != "—":
                     tree_items.append(f"<b>Social:</b> {social_links}")
-                    
-                if tree_items:
-                    for i, item in enumerate(tree_items):
-                        if i == len(tree_items) - 1:  # Last item  
-                            message += f"\n└── {item}"
-                        else:
-                            message += f"\n├── {item}"
-                else:
-                    # If no optional items, make Stats the last item
-                    message = message.replace("├── <b>Stats:</b>", "└── <b>Stats:</b>")
-
-                message += f"""
-
-<b>Network:</b> {chain_name} • Zora • Block #{block_number}
-<b>Created:</b> {tx_link} • {datetime.utcnow().strftime('%d-%m-%Y %H:%M UTC')} {relative_time}"""
                 
-                logger.debug("Enhanced message built successfully", message_length=len(message))
+                # Stats closes the tree when there are no optional fields
+                stats_branch = "├──" if tree_items else "└──"
+                
+                # Header from the shared template, then the tail lines, joined once
+                lines = [_render_message(
+                    "zora",
+                    display_name=display_name,
+                    symbol=symbol,
+                    token_address=token_address,
+                    creator_display=creator_display,
+                    zora_profile_link=zora_profile_link,
+                    clean_name=clean_name,
+                    verified_emoji=verified_emoji,
+                    stats_branch=stats_branch,
+                    market_cap=market_cap,
+                    delta_formatted=delta_formatted,
+                    volume_24h=volume_24h,
+                    total_volume=total_volume,
+                    unique_holders=self._safe_format_int(unique_holders),
+                    followers=self._safe_format_int(followers),
+                    following=self._safe_format_int(following)
+                )]
+                last_item = len(tree_items) - 1
+                for i, item in enumerate(tree_items):
+                    lines.append(f"{_TREE_END if i == last_item else _TREE_MID}{item}")
+                lines.append("")
+                lines.append(_render_message(
+                    "footer",
+                    chain_name=chain_name,
+                    source_label="Zora",
+                    block_number=block_number,
+                    tx_link=tx_link,
+                    created_at=created_at,
+                    relative_time=relative_time
+                ))
+                message = "\n".join(lines)
+                
+                if self._debug_enabled:
+                    self._log.debug("Enhanced message built successfully", message_length=len(message))
                 return message
                 
             except Exception as e:
-                logger.warning("Error building enhanced message components", error=str(e))
+                self._log.warning("Error building enhanced message components", error=str(e))
                 raise  # Re-raise to trigger fallback
             
         except Exception as e:
             import traceback
             error_traceback = traceback.format_exc()
-            logger.warning("Error building enhanced Zora message, falling back to basic format", 
-                          profile_id=zora_profile_link.split('@')[1] if '@' in zora_profile_link else "unknown",
-                          error=str(e),
-                          traceback=error_traceback)
+            self._log.warning("Error building enhanced Zora message, falling back to basic format", 
+                             profile_id=clean_name,
+                             error=str(e),
+                             traceback=error_traceback)
             
             # Fallback to basic message format
-            clean_name = zora_profile_link.split('@')[1] if '@' in zora_profile_link else name
-            return f"""🎨 <b>Zora Token:</b> {name} ({symbol})
-├── <b>CA:</b> <code>{token_address}</code>
-├── <b>Creator:</b> {creator_display}
-└── <b>Profile:</b> <a href=\"{zora_profile_link}\">@{clean_name}</a>
-
-<b>Network:</b> {chain_name} • Zora • Block #{block_number}
-<b>Created:</b> {tx_link} • {datetime.utcnow().strftime('%d-%m-%Y %H:%M UTC')} {relative_time}"""
+            return _render_message(
+                "zora_basic",
+                name=name,
+                symbol=symbol,
+                token_address=token_address,
+                creator_display=creator_display,
+                zora_profile_link=zora_profile_link,
+                clean_name=clean_name,
+                chain_name=chain_name,
+                block_number=block_number,
+                tx_link=tx_link,
+                created_at=created_at,
+                relative_time=relative_time
+            )
     
     async def _send_photo_with_caption_if_available(self, profile_data: Dict, caption: str) -> bool:
         """Send photo with caption if avatar is available."""
@@ -1370,23 +1806,48 @@ class TelegramNotifier:
             if not avatar_url:
                 return False
             
-            # Send photo with caption to all chats
-            tasks = []
-            for chat_id in self.chat_ids:
-                task = self._send_photo_to_chat(avatar_url, chat_id, caption)
-                tasks.append(task)
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            successful_sends = sum(1 for result in results if result and not isinstance(result, Exception))
-            
-            logger.info("Photo with caption send results",
-                       successful_sends=successful_sends,
-                       total_chats=len(self.chat_ids))
+            if not self.chat_ids:
+                return False
             
-            return successful_sends > 0
+            # Upload to the first chat so Telegram fetches the image once; the
+            # other chats reuse the returned file_id instead of the URL
+            first_chat_id, *other_chat_ids = self.chat_ids
+            sent = await self._send_photo_to_chat(avatar_url, first_chat_id, caption)
+            photo = (_photo_file_id(sent) or avatar_url) if sent is not None else avatar_url
+            
+            # Remaining chats are sent concurrently; return on the first success and
+            # let the rest finish in the background
+            tasks = [
+                asyncio.create_task(self._send_photo_to_chat(photo, chat_id, caption))
+                for chat_id in other_chat_ids
+            ]
+            for task in tasks:
+                self._bg_tasks.add(task)
+                task.add_done_callback(self._bg_tasks.discard)
+            
+            if sent is not None:
+                self._log.info("Photo with caption sent",
+                              reused_file_id=photo is not avatar_url,
+                              pending_sends=len(tasks),
+                              total_chats=len(self.chat_ids))
+                return True
+            
+            for next_done in asyncio.as_completed(tasks):
+                # _send_photo_to_chat handles its own errors and returns None on failure
+                if await next_done is not None:
+                    self._log.info("Photo with caption sent",
+                                  reused_file_id=False,
+                                  pending_sends=sum(1 for task in tasks if not task.done()),
+                                  total_chats=len(self.chat_ids))
+                    return True
+            
+            self._log.info("Photo with caption send results",
+                          successful_sends=0,
+                          total_chats=len(self.chat_ids))
+            return False
             
         except Exception as e:
-            logger.debug("Failed to send photo with caption", error=str(e))
+            self._log.debug("Failed to send photo with caption", error=str(e))
             return False
     
     def _convert_ipfs_to_http(self, ipfs_uri: str, gateway_index: int = 0) -> str:
@@ -1406,17 +1867,26 @@ class TelegramNotifier:
         # Extract hash from ipfs://hash
         ipfs_hash = ipfs_uri[7:]  # Remove "ipfs://" prefix
         
-        # Multiple IPFS gateways for reliability
-        gateways = [
-            "https://ipfs.io/ipfs/",
-            "https://dweb.link/ipfs/",
-            "https://nftstorage.link/ipfs/",
-            "https://w3s.link/ipfs/",
-        ]
-        
-        gateway = gateways[gateway_index % len(gateways)]
+        gateway = _IPFS_GATEWAYS[gateway_index % len(_IPFS_GATEWAYS)]
         return f"{gateway}{ipfs_hash}"
 
+    def _resolve_image_url(self, url: str, gateway_index: int = 0) -> Optional[str]:
+        """
+        Turn an image link from token metadata into a fetchable HTTPS URL.
+        
+        Args:
+            url: Image URL or IPFS URI
+            gateway_index: Gateway to use for IPFS URIs
+            
+        Returns:
+            HTTPS URL, or None for unsupported schemes
+        """
+        if url.startswith("ipfs://"):
+            return self._convert_ipfs_to_http(url, gateway_index)
+        if url.startswith("https://"):
+            return url
+        return None
+
     async def _fetch_token_metadata_and_image(self, metadata_uri: str) -> Optional[str]:
         """
         Fetch token metadata and extract image URL with IPFS gateway fallback.
@@ -1430,124 +1900,139 @@ class TelegramNotifier:
         if not self.session or not metadata_uri:
             return None
         
-        # For IPFS URIs, try multiple gateways
-        max_gateway_attempts = 4 if metadata_uri.startswith("ipfs://") else 1
+        # For IPFS URIs, try each gateway; HTTPS URIs are fetched as-is
+        if metadata_uri.startswith("ipfs://"):
+            ipfs_hash = metadata_uri[7:]
+            metadata_urls = [f"{gateway}{ipfs_hash}" for gateway in _IPFS_GATEWAYS]
+        elif metadata_uri.startswith("https://"):
+            metadata_urls = [metadata_uri]
+        else:
+            self._log.debug("Unsupported metadata URI format", uri=metadata_uri)
+            return None
+        max_gateway_attempts = len(metadata_urls)
         
-        for gateway_index in range(max_gateway_attempts):
-            try:
-                # Convert IPFS URI to HTTP if needed
-                if metadata_uri.startswith("ipfs://"):
-                    http_url = self._convert_ipfs_to_http(metadata_uri, gateway_index)
-                elif metadata_uri.startswith("https://"):
-                    http_url = metadata_uri
-                else:
-                    logger.debug("Unsupported metadata URI format", uri=metadata_uri)
-                    return None
-                
-                logger.debug("Fetching token metadata", 
-                           uri=http_url, 
-                           attempt=gateway_index + 1, 
-                           max_attempts=max_gateway_attempts)
+        # Race the gateways with a small hedge: keep up to
+        # _METADATA_FETCH_CONCURRENCY requests in flight, start the next gateway
+        # whenever one fails, and stop at the first gateway that answers
+        pending = set()
+        next_index = 0
+        try:
+            while next_index < max_gateway_attempts or pending:
+                while next_index < max_gateway_attempts and len(pending) < _METADATA_FETCH_CONCURRENCY:
+                    pending.add(asyncio.create_task(self._fetch_metadata_from_gateway(
+                        metadata_uri, metadata_urls[next_index], next_index, max_gateway_attempts
+                    )))
+                    next_index += 1
                 
-                async with self.session.get(
-                    http_url,
-                    timeout=aiohttp.ClientTimeout(total=15)
-                ) as response:
-                    if response.status == 200:
-                        try:
-                            metadata = await response.json()
-                            
-                            # Try to extract image from metadata
-                            # For token metadata, image is typically stored in "image" field
-                            image_url = metadata.get("image")
-                            
-                            logger.debug("Checking for image in metadata", 
-                                       metadata_uri=metadata_uri,
-                                       has_image_field=bool(image_url),
-                                       image_value=image_url[:50] + "..." if image_url and len(str(image_url)) > 50 else image_url)
-                            
-                            if image_url:
-                                # Convert IPFS image URL to HTTP if needed
-                                if image_url.startswith("ipfs://"):
-                                    # This is an IPFS image link - convert to HTTP gateway
-                                    http_image_url = self._convert_ipfs_to_http(image_url, gateway_index)
-                                    
-                                    logger.debug("Found IPFS image link in metadata", 
-                                               metadata_uri=metadata_uri,
-                                               gateway_used=http_url,
-                                               ipfs_image_url=image_url,
-                                               http_image_url=http_image_url[:100] + "..." if len(http_image_url) > 100 else http_image_url)
-                                    
-                                    return http_image_url
-                                elif image_url.startswith("https://"):
-                                    # Already HTTP URL
-                                    logger.debug("Found HTTPS image link in metadata", 
-                                               metadata_uri=metadata_uri,
-                                               gateway_used=http_url,
-                                               image_url=image_url[:100] + "..." if len(image_url) > 100 else image_url)
-                                    return image_url
-                                else:
-                                    # Relative or other format - try to construct full URL
-                                    logger.debug("Found relative image link in metadata", 
-                                               metadata_uri=metadata_uri,
-                                               gateway_used=http_url,
-                                               raw_image_url=image_url)
-                                    # Could implement base URL resolution here if needed
-                                    return image_url
-                            
-                            # Also check nested content.uri field as fallback
-                            content = metadata.get("content", {})
-                            if isinstance(content, dict) and content.get("uri"):
-                                content_uri = content["uri"]
-                                if content_uri.startswith("ipfs://"):
-                                    http_content_url = self._convert_ipfs_to_http(content_uri, gateway_index)
-                                    logger.debug("Found IPFS content URI as image fallback", 
-                                               metadata_uri=metadata_uri,
-                                               content_uri=content_uri,
-                                               http_content_url=http_content_url[:100] + "..." if len(http_content_url) > 100 else http_content_url)
-                                    return http_content_url
-                                elif content_uri.startswith("https://"):
-                                    logger.debug("Found HTTPS content URI as image fallback", 
-                                               metadata_uri=metadata_uri,
-                                               content_uri=content_uri)
-                                    return content_uri
-                            
-                            logger.debug("No image field found in metadata", 
-                                       metadata_uri=metadata_uri,
-                                       available_fields=list(metadata.keys()),
-                                       has_content=bool(metadata.get("content")))
-                            return None  # No image found, don't try other gateways
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    answered, image_url = task.result()
+                    if answered:
+                        return image_url
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        self._log.warning("Failed to fetch metadata from all gateways", 
+                        metadata_uri=metadata_uri,
+                        attempts=max_gateway_attempts)
+        return None
+
+    async def _fetch_metadata_from_gateway(
+        self, metadata_uri: str, http_url: str, gateway_index: int, max_attempts: int
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Fetch token metadata from one gateway URL and extract the image URL.
+        
+        Args:
+            metadata_uri: Original metadata URI (for logging)
+            http_url: Gateway URL to fetch
+            gateway_index: Gateway position, reused for IPFS image links
+            max_attempts: Total number of gateways (for logging)
+            
+        Returns:
+            (answered, image_url): answered is False when another gateway should be tried
+        """
+        try:
+            self._log.debug("Fetching token metadata", 
+                          uri=http_url, 
+                          attempt=gateway_index + 1, 
+                          max_attempts=max_attempts)
+            
+            async with self.session.get(
+                http_url,
+                timeout=_TIMEOUT_LONG
+            ) as response:
+                if response.status == 200:
+                    try:
+                        # Gateways often serve JSON as text/plain; parse the raw bytes directly
+                        metadata = orjson.loads(await response.read())
                         
-                        except json.JSONDecodeError as e:
-                            logger.warning("Failed to parse metadata JSON", 
-                                         metadata_uri=metadata_uri, 
-                                         gateway_used=http_url,
-                                         error=str(e))
-                            return None  # Invalid JSON, don't try other gateways
-                    else:
-                        logger.warning("Failed to fetch metadata", 
-                                     metadata_uri=metadata_uri, 
-                                     gateway_used=http_url,
-                                     status=response.status,
-                                     attempt=gateway_index + 1)
-                        # Continue to next gateway
-            
-            except asyncio.TimeoutError:
-                logger.warning("Timeout fetching metadata", 
+                        # Try to extract image from metadata
+                        # For token metadata, image is typically stored in "image" field
+                        image_url = metadata.get("image")
+                        
+                        self._log.debug("Checking for image in metadata", 
+                                      metadata_uri=metadata_uri,
+                                      has_image_field=bool(image_url),
+                                      image_value=_trunc(image_url, 50) if image_url else image_url)
+                        
+                        if image_url:
+                            # Relative or other formats are passed through unchanged
+                            # (base URL resolution could be added here if needed)
+                            resolved_url = self._resolve_image_url(image_url, gateway_index) or image_url
+                            self._log.debug("Found image link in metadata", 
+                                          metadata_uri=metadata_uri,
+                                          gateway_used=http_url,
+                                          image_url=_trunc(image_url, 100),
+                                          resolved_url=_trunc(resolved_url, 100))
+                            return True, resolved_url
+                        
+                        # Also check nested content.uri field as fallback
+                        content = metadata.get("content", {})
+                        if isinstance(content, dict) and content.get("uri"):
+                            content_uri = content["uri"]
+                            resolved_url = self._resolve_image_url(content_uri, gateway_index)
+                            if resolved_url:
+                                self._log.debug("Found content URI as image fallback", 
+                                              metadata_uri=metadata_uri,
+                                              content_uri=content_uri,
+                                              resolved_url=_trunc(resolved_url, 100))
+                                return True, resolved_url
+                        
+                        self._log.debug("No image field found in metadata", 
+                                      metadata_uri=metadata_uri,
+                                      available_fields=list(metadata.keys()),
+                                      has_content=bool(metadata.get("content")))
+                        return True, None  # No image found, don't try other gateways
+                    
+                    except orjson.JSONDecodeError as e:
+                        self._log.warning("Failed to parse metadata JSON", 
+                                        metadata_uri=metadata_uri, 
+                                        gateway_used=http_url,
+                                        error=str(e))
+                        return True, None  # Invalid JSON, don't try other gateways
+                else:
+                    self._log.warning("Failed to fetch metadata", 
+                                    metadata_uri=metadata_uri, 
+                                    gateway_used=http_url,
+                                    status=response.status,
+                                    attempt=gateway_index + 1)
+                    # Continue to next gateway
+        
+        except asyncio.TimeoutError:
+            self._log.warning("Timeout fetching metadata", 
+                            metadata_uri=metadata_uri,
+                            attempt=gateway_index + 1)
+            # Continue to next gateway
+        except Exception as e:
+            self._log.warning("Error fetching metadata", 
                              metadata_uri=metadata_uri,
-                             attempt=gateway_index + 1)
-                # Continue to next gateway
-            except Exception as e:
-                logger.warning("Error fetching metadata", 
-                              metadata_uri=metadata_uri,
-                              attempt=gateway_index + 1,
-                              error=str(e))
-                # Continue to next gateway
+                             attempt=gateway_index + 1,
+                             error=str(e))
+            # Continue to next gateway
         
-        logger.warning("Failed to fetch metadata from all gateways", 
-                     metadata_uri=metadata_uri,
-                     attempts=max_gateway_attempts)
-        return None
+        return False, None
 
     async def _fetch_farcaster_user_data(self, username: str) -> Optional[Dict[str, Any]]:
         """
@@ -1567,41 +2052,51 @@ class TelegramNotifier:
             
             async with self.session.get(
                 api_url,
-                timeout=aiohttp.ClientTimeout(total=10)
+                timeout=_TIMEOUT_SHORT
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    result = data.get("result", {})
-                    user_data = result.get("user", {})
+                    data = orjson.loads(await response.read())
+                    result = data.get("result") or {}
+                    user_data = result.get("user") or {}
                     
                     if user_data:
-                        logger.debug("Successfully fetched Farcaster data", 
-                                   username=username,
-                                   fid=user_data.get("fid"),
-                                   follower_count=user_data.get("followerCount", 0))
+                        self._log.debug("Successfully fetched Farcaster data", 
+                                      username=username,
+                                      fid=user_data.get("fid"),
+                                      follower_count=user_data.get("followerCount", 0))
                         return user_data
                     else:
-                        logger.warning("No user data found in Farcaster response", username=username)
+                        self._log.warning("No user data found in Farcaster response", username=username)
                 else:
-                    logger.warning("Farcaster API HTTP error", 
-                                 username=username, 
-                                 status=response.status)
+                    self._log.warning("Farcaster API HTTP error", 
+                                    username=username, 
+                                    status=response.status)
                     
         except asyncio.TimeoutError:
-            logger.warning("Farcaster API timeout", username=username)
+            self._log.warning("Farcaster API timeout", username=username)
         except Exception as e:
-            logger.warning("Failed to fetch Farcaster data", 
-                          username=username, 
-                          error=str(e))
+            self._log.warning("Failed to fetch Farcaster data", 
+                             username=username, 
+                             error=str(e))
         
         return None
 
-    async def _send_photo_to_chat(self, photo_url: str, chat_id: str, caption: str = None) -> bool:
-        """Send photo to specific chat with optional caption."""
+    async def _send_photo_to_chat(self, photo: str, chat_id: str, caption: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Send photo to specific chat with optional caption.
+        
+        Args:
+            photo: Photo URL or file_id of a photo Telegram already has
+            chat_id: Target chat ID
+            caption: Optional HTML caption
+            
+        Returns:
+            The sent Telegram message, or None if the send failed
+        """
         try:
             payload = {
                 "chat_id": chat_id,
-                "photo": photo_url,
+                "photo": photo,
                 "disable_notification": True
             }
             
@@ -1610,23 +2105,26 @@ class TelegramNotifier:
                 payload["caption"] = caption
                 payload["parse_mode"] = "HTML"
             
-            async with self.session.post(
-                f"{self.base_url}/sendPhoto",
-                data=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("ok", False)
-                else:
-                    logger.debug("Photo send HTTP error", 
-                               chat_id=chat_id, 
-                               status=response.status)
-                return False
+            # Bound concurrent sendPhoto calls so a fan-out stays under Telegram rate limits
+            async with self._photo_send_sem:
+                async with self.session.post(
+                    f"{self.base_url}/sendPhoto",
+                    data=payload,
+                    timeout=_PHOTO_TIMEOUT
+                ) as response:
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        if data.get("ok"):
+                            return data.get("result") or {}
+                    else:
+                        self._log.debug("Photo send HTTP error", 
+                                      chat_id=chat_id, 
+                                      status=response.status)
+                    return None
                 
         except Exception as e:
-            logger.debug("Error sending photo", chat_id=chat_id, error=str(e))
-            return False
+            self._log.debug("Error sending photo", chat_id=chat_id, error=str(e))
+            return None
     
     def _extract_additional_metadata(self, token_info: Dict[str, Any]) -> Optional[str]:
         """
@@ -1638,68 +2136,39 @@ class TelegramNotifier:
         Returns:
             Formatted metadata string or None
         """
-        # Try multiple sources for metadata, in order of preference
-        
-        # 1. Try metadata_json field (already parsed object)
-        metadata_json = token_info.get("metadata_json")
-        if metadata_json and isinstance(metadata_json, dict):
-            description = metadata_json.get("description", "")
-            if description and len(description.strip()) > 0:
-                clean_description = description.strip()
-                if len(clean_description) > 150:
-                    clean_description = clean_description[:150] + "..."
-                return clean_description
-        
-        # 2. Try token_metadata as JSON string (root level)
-        token_metadata = token_info.get("token_metadata", "")
-        if token_metadata and isinstance(token_metadata, str) and len(token_metadata.strip()) > 0:
-            try:
-                parsed_metadata = json.loads(token_metadata)
-                if isinstance(parsed_metadata, dict):
-                    description = parsed_metadata.get("description", "")
-                    if description and len(description.strip()) > 0:
-                        clean_description = description.strip()
-                        if len(clean_description) > 150:
-                            clean_description = clean_description[:150] + "..."
-                        return clean_description
-            except json.JSONDecodeError:
-                logger.debug("Failed to parse token_metadata as JSON", 
-                           token_metadata=token_metadata[:100] + "..." if len(token_metadata) > 100 else token_metadata)
-        
-        # 3. Try raw_event_data.token_metadata (nested path)
-        raw_event_data = token_info.get("raw_event_data", {})
-        if isinstance(raw_event_data, dict):
-            raw_token_metadata = raw_event_data.get("token_metadata", "")
-            if raw_token_metadata and isinstance(raw_token_metadata, str) and len(raw_token_metadata.strip()) > 0:
-                try:
-                    parsed_metadata = json.loads(raw_token_metadata)
-                    if isinstance(parsed_metadata, dict):
-                        description = parsed_metadata.get("description", "")
-                        if description and len(description.strip()) > 0:
-                            clean_description = description.strip()
-                            if len(clean_description) > 150:
-                                clean_description = clean_description[:150] + "..."
-                            return clean_description
-                except json.JSONDecodeError:
-                    logger.debug("Failed to parse raw_event_data.token_metadata as JSON", 
-                               token_metadata=raw_token_metadata[:100] + "..." if len(raw_token_metadata) > 100 else raw_token_metadata)
-        
-        # 4. Fallback: Try different possible field names for additional metadata
-        metadata_fields = [
-            'additional_metadata',
-            'additionalMetadata', 
-            'extra_metadata',
-            'metadata_extra',
-            'token_description',
-            'description'
-        ]
-        
-        for field in metadata_fields:
+        # Try multiple sources for metadata, in order of preference:
+        # metadata_json (already parsed object), then the token_metadata JSON
+        # strings at the root and under raw_event_data
+        raw_event_data = token_info.get("raw_event_data")
+        candidates = (
+            ("metadata_json", token_info.get("metadata_json"), False),
+            ("token_metadata", token_info.get("token_metadata"), True),
+            ("raw_event_data.token_metadata",
+             raw_event_data.get("token_metadata") if isinstance(raw_event_data, dict) else None, True),
+        )
+        for source, value, needs_parse in candidates:
+            if needs_parse:
+                if not isinstance(value, str) or not value.strip():
+                    continue
+                # Shares the parse cache with _extract_retake_info
+                parsed = _parse_metadata_json(value)
+                if parsed is None:
+                    self._log.debug("Token metadata is not a JSON object",
+                                  source=source,
+                                  token_metadata=_trunc(value, 100))
+                    continue
+                value = parsed
+            if isinstance(value, dict):
+                description = value.get("description", "")
+                if description and description.strip():
+                    return _trunc(description.strip(), 150)
+        
+        # Fallback: Try different possible field names for additional metadata
+        for field in _METADATA_FIELDS:
             metadata = token_info.get(field)
-            if metadata and isinstance(metadata, str) and len(metadata.strip()) > 0:
-                clean_metadata = metadata.strip()
-                if len(clean_metadata) > 150:
-                    clean_metadata = clean_metadata[:150] + "..."
-                return clean_metadata
+            if isinstance(metadata, str):
+                metadata = metadata.strip()
+                if metadata:
+                    return _trunc(metadata, 150)
         
         return None
@@ -1,8 +1,10 @@
 from pydantic_settings import BaseSettings
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import os
 from pathlib import Path
 
+import orjson
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -15,6 +17,7 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379"
     redis_db: int = 0
     redis_key_prefix: str = "moonx:indexer"
+    redis_max_connections: int = 50  # Shared by every chain's cache repository
     
     # Worker settings  
     worker_interval_seconds: int = 15  # Reduced to 15 seconds for faster swap processing
@@ -29,6 +32,9 @@ class Settings(BaseSettings):
     rpc_max_retries: int = 3  # Method-level retries
     rpc_retry_delay: int = 2  # Base delay between retries
     max_blocks_per_request: int = 2000
+    logs_batch_size: int = 20  # eth_getLogs calls per JSON-RPC batch request
+    http_pool_size: int = 64  # Keep-alive RPC connections per chain
+    logs_cache_size: int = 1024  # Confirmed eth_getLogs ranges cached per chain (0 disables)
     
     # Lock settings
     lock_timeout_seconds: int = 300  # 5 minutes
@@ -38,6 +44,9 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_format: str = "json"
     
+    # Health monitoring
+    health_monitor_interval_seconds: int = 30  # Background refresh of the readiness status; keep >= probe period
+    
     # Scalability  
     enable_distributed_processing: bool = True
     worker_pool_size: int = 4
@@ -53,9 +62,32 @@ class Settings(BaseSettings):
         env_prefix = "MOONX_"
 
 
+# Pool config keys naming the contract and topic whose logs announce new pools.
+# Uniswap V4 emits them from the singleton pool manager; every other protocol
+# uses a factory.
+POOL_LOG_KEYS: Dict[str, Tuple[str, str]] = {
+    "uniswap_v4": ("pool_manager", "pool_init_topic"),
+}
+DEFAULT_POOL_LOG_KEYS: Tuple[str, str] = ("factory", "pool_created_topic")
+
+
+def pool_log_target(pool_config: Dict) -> Tuple[str, str]:
+    """Return the (contract address, topic) to query for a pool config's creation logs."""
+    contract_key, topic_key = POOL_LOG_KEYS.get(pool_config["protocol"], DEFAULT_POOL_LOG_KEYS)
+    return pool_config[contract_key], pool_config[topic_key]
+
+
 class ChainConfig:
     """Chain-specific configuration."""
     
+    # Read on every RPC call; slots avoid a per-instance __dict__
+    __slots__ = (
+        "chain_id", "name", "rpc_urls", "rpc_url", "backup_rpc_urls", "current_rpc_index",
+        "block_time", "confirmation_blocks", "start_block", "max_block_range",
+        "gas_price_strategy", "pools", "contracts", "special_tokens", "monitoring",
+        "performance", "features", "indexing", "enabled_pools", "enabled_pool_count",
+    )
+    
     def __init__(
         self,
         chain_id: int,
@@ -89,6 +121,9 @@ class ChainConfig:
         self.max_block_range = max_block_range
         self.gas_price_strategy = gas_price_strategy
         self.pools = pools  # List of pool configurations
+        # Filtered once here instead of by every caller that only wants enabled pools
+        self.enabled_pools = tuple(p for p in pools if p.get("enabled", True))
+        self.enabled_pool_count = len(self.enabled_pools)
         self.contracts = contracts  # Contract addresses
         self.special_tokens = special_tokens or {}
         self.monitoring = monitoring or {}
@@ -99,13 +134,12 @@ class ChainConfig:
     @classmethod
     def load_from_file(cls, config_path: Path) -> "ChainConfig":
         """Load chain configuration from JSON file."""
-        import json
-        
-        with open(config_path, 'r') as f:
-            data = json.load(f)
+        with open(config_path, 'rb') as f:
+            data = orjson.loads(f.read())
         
         # Support both rpc_url (backward compatibility) and rpc_urls (new format)
-        rpc_url = data.get("rpc_url", data.get("rpc_urls", [None])[0] if data.get("rpc_urls") else None)
+        rpc_urls = data.get("rpc_urls")
+        rpc_url = data["rpc_url"] if "rpc_url" in data else (rpc_urls[0] if rpc_urls else None)
         
         return cls(
             chain_id=data["chain_id"],
@@ -116,7 +150,7 @@ class ChainConfig:
             pools=data["pools"],
             contracts=data["contracts"],
             backup_rpc_urls=data.get("backup_rpc_urls"),
-            rpc_urls=data.get("rpc_urls"),
+            rpc_urls=rpc_urls,
             confirmation_blocks=data.get("confirmation_blocks", 5),
             max_block_range=data.get("max_block_range", 2000),
             gas_price_strategy=data.get("gas_price_strategy", "fast"),
@@ -10,26 +10,109 @@ This script will:
 Usage:
     python fix_swap_indexing.py --chain-id 8453 --dry-run  # Preview changes
     python fix_swap_indexing.py --chain-id 8453 --apply    # Apply fixes
+    python fix_swap_indexing.py --chain-id 8453 --dry-run --pretty  # Human-readable pool events
 """
 
+from __future__ import annotations
+
 import asyncio
-import argparse
-from typing import List
-from motor.motor_asyncio import AsyncIOMotorClient
+from typing import Any, AsyncIterator, Dict
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCommandCursor
 from datetime import datetime
 import sys
+import orjson
+import structlog
+
+# Below this many swap progress records, join them with pools in memory instead of via $lookup
+_IN_MEMORY_JOIN_MAX_PROGRESS = 100_000
+_POOLS_HINT = [("chain_id", 1), ("creation_block", 1)]
+
+logger = structlog.get_logger()
 
 class SwapIndexingFixer:
     def __init__(self, mongodb_url: str = "mongodb://localhost:27017"):
-        self.client = AsyncIOMotorClient(mongodb_url)
+        # One aggregation plus one bulk delete: a small pool is plenty
+        self.client = AsyncIOMotorClient(
+            mongodb_url,
+            maxPoolSize=10,
+            minPoolSize=2,
+            compressors="zstd,zlib",
+            zlibCompressionLevel=3,
+            serverSelectionTimeoutMS=5000,
+            retryWrites=True
+        )
         self.db = self.client.moonx_indexer
+    
+    @classmethod
+    async def create(cls, mongodb_url: str = "mongodb://localhost:27017") -> "SwapIndexingFixer":
+        """Create a fixer and ensure the indexes used by the lookup and reset queries."""
+        fixer = cls(mongodb_url)
+        await fixer.ensure_indexes()
+        return fixer
+    
+    async def ensure_indexes(self) -> None:
+        """Create indexes backing find_affected_pools and the fix_pools progress reset."""
+        # Same definition as MongoProgressRepository, so this is a no-op once the worker has run
+        await self.db.indexer_progress.create_index(
+            [("chain_id", 1), ("indexer_type", 1), ("pool_address", 1)], unique=True
+        )
+        await self.db.pools.create_index([("chain_id", 1), ("creation_block", 1)])
+        
+    @staticmethod
+    def _candidate_pools_filter(chain_id: int) -> Dict[str, Any]:
+        """Filter for pools whose last_indexed_block is past creation_block."""
+        # A missing last_indexed_block never compares greater, so those pools are skipped
+        return {
+            "chain_id": chain_id,
+            "creation_block": {"$exists": True},
+            "$expr": {"$gt": ["$last_indexed_block", "$creation_block"]}
+        }
+    
+    async def find_affected_pools(self, chain_id: int) -> AsyncIterator[dict]:
+        """Yield pools affected by the start_block bug."""
+        # Pools where last_indexed_block is past creation_block and there's no swap
+        # progress yet, or it starts after creation_block (indicating the bug)
+        progress_count = await self.db.indexer_progress.count_documents(
+            {"chain_id": chain_id, "indexer_type": "swaps"}
+        )
         
-    async def find_affected_pools(self, chain_id: int) -> List[dict]:
-        """Find pools affected by the start_block bug."""
-        # Pools where last_indexed_block doesn't match creation_block
-        # and there's no swap progress yet (indicating they haven't been properly indexed)
+        if progress_count < _IN_MEMORY_JOIN_MAX_PROGRESS:
+            async for pool in self._join_affected_pools_in_memory(chain_id):
+                yield pool
+        else:
+            async for pool in self._aggregate_affected_pools(chain_id):
+                yield pool
+    
+    async def _join_affected_pools_in_memory(self, chain_id: int) -> AsyncIterator[dict]:
+        """Load the chain's swap progress once and classify pools locally."""
+        progress: Dict[str, Any] = {}
+        async for p in self.db.indexer_progress.find(
+            {"chain_id": chain_id, "indexer_type": "swaps"},
+            {"_id": 0, "pool_address": 1, "last_processed_block": 1}
+        ):
+            progress.setdefault(p["pool_address"], p.get("last_processed_block"))
+        
+        cursor = self.db.pools.find(
+            self._candidate_pools_filter(chain_id),
+            {"_id": 0, "pool_address": 1, "creation_block": 1, "last_indexed_block": 1, "protocol": 1},
+            hint=_POOLS_HINT,
+            batch_size=500
+        )
+        async for pool in cursor:
+            if pool["pool_address"] in progress:
+                last_processed = progress[pool["pool_address"]]
+                if last_processed is None or last_processed <= pool["creation_block"]:
+                    continue
+            else:
+                last_processed = None
+            pool["swap_progress"] = last_processed
+            yield pool
+    
+    def _aggregate_affected_pools(self, chain_id: int) -> AsyncIOMotorCommandCursor:
+        """Return a cursor over affected pools, joining swap progress via $lookup."""
+        # Pools that can't be affected are dropped before the lookup
         pipeline = [
-            {"$match": {"chain_id": chain_id}},
+            {"$match": self._candidate_pools_filter(chain_id)},
             {
                 "$lookup": {
                     "from": "indexer_progress",
@@ -45,7 +128,10 @@ class SwapIndexingFixer:
                                     ]
                                 }
                             }
-                        }
+                        },
+                        # Only the first progress record is inspected below
+                        {"$limit": 1},
+                        {"$project": {"_id": 0, "last_processed_block": 1}}
                     ],
                     "as": "swap_progress"
                 }
@@ -64,84 +150,85 @@ class SwapIndexingFixer:
                         }
                     ]
                 }
+            },
+            # Keep only the fields fix_pools reads; swap_progress becomes a scalar or null
+            {
+                "$project": {
+                    "_id": 0,
+                    "pool_address": 1,
+                    "creation_block": 1,
+                    "last_indexed_block": 1,
+                    "protocol": 1,
+                    "swap_progress": {"$arrayElemAt": ["$swap_progress.last_processed_block", 0]}
+                }
             }
         ]
         
-        cursor = self.db.pools.aggregate(pipeline)
-        return await cursor.to_list(None)
-    
-    async def reset_swap_progress(self, pool_address: str, chain_id: int, dry_run: bool = True) -> bool:
-        """Reset swap progress for a pool to start from creation_block."""
-        if dry_run:
-            print(f"  [DRY-RUN] Would reset swap progress for {pool_address}")
-            return True
-            
-        try:
-            # Delete existing swap progress
-            result = await self.db.indexer_progress.delete_many({
-                "chain_id": chain_id,
-                "pool_address": pool_address,
-                "indexer_type": "swaps"
-            })
-            
-            print(f"  ✅ Reset swap progress for {pool_address} (deleted {result.deleted_count} records)")
-            return True
-            
-        except Exception as e:
-            print(f"  ❌ Failed to reset progress for {pool_address}: {e}")
-            return False
+        # Pin the index created in ensure_indexes so the planner can't pick another one
+        return self.db.pools.aggregate(
+            pipeline,
+            hint=_POOLS_HINT,
+            allowDiskUse=False
+        ).batch_size(500)
     
     async def fix_pools(self, chain_id: int, dry_run: bool = True) -> dict:
         """Fix swap indexing for affected pools."""
         print(f"🔍 Analyzing pools on chain {chain_id}...")
         
-        affected_pools = await self.find_affected_pools(chain_id)
-        
-        if not affected_pools:
-            print("✅ No pools found with swap indexing issues!")
-            return {"total": 0, "fixed": 0, "errors": 0}
-        
-        print(f"🚨 Found {len(affected_pools)} pools with potential swap indexing issues:")
-        print()
+        stats = {"total": 0, "fixed": 0, "errors": 0}
+        to_reset = []
         
-        stats = {"total": len(affected_pools), "fixed": 0, "errors": 0}
+        # Flush pending prints so they stay ahead of the byte-level log writes
+        sys.stdout.flush()
         
-        for pool in affected_pools:
+        # Stream pools as batches arrive instead of buffering the whole result
+        async for pool in self.find_affected_pools(chain_id):
+            stats["total"] += 1
+            
             pool_addr = pool["pool_address"]
             creation_block = pool["creation_block"]
             last_indexed = pool.get("last_indexed_block", 0)
-            protocol = pool["protocol"]
             
             # Get current swap progress
-            swap_progress = pool.get("swap_progress", [])
-            current_progress = swap_progress[0] if swap_progress else None
-            
-            print(f"📊 Pool: {pool_addr}")
-            print(f"   Protocol: {protocol}")
-            print(f"   Creation block: {creation_block:,}")
-            print(f"   Last indexed block: {last_indexed:,}")
-            
-            if current_progress:
-                print(f"   Current swap progress: {current_progress['last_processed_block']:,}")
-                if current_progress['last_processed_block'] <= creation_block:
-                    print("   ✅ Swap progress looks correct, skipping")
-                    continue
-            else:
-                print("   ⚠️  No swap progress found")
-            
-            # Calculate missed blocks
-            if last_indexed > creation_block:
-                missed_blocks = last_indexed - creation_block
-                print(f"   🚨 Potentially missed {missed_blocks:,} blocks of swap events!")
+            current_progress = pool.get("swap_progress")
+            needs_reset = current_progress is None or current_progress > creation_block
             
-            # Fix the pool
-            success = await self.reset_swap_progress(pool_addr, chain_id, dry_run)
-            if success:
-                stats["fixed"] += 1
-            else:
-                stats["errors"] += 1
+            logger.info(
+                "pool",
+                address=pool_addr,
+                protocol=pool["protocol"],
+                creation_block=creation_block,
+                last_indexed=last_indexed,
+                current_progress=current_progress,
+                missed_blocks=max(last_indexed - creation_block, 0),
+                action=("would_reset" if dry_run else "reset") if needs_reset else "skip"
+            )
             
-            print()
+            if needs_reset:
+                to_reset.append(pool_addr)
+        
+        if not stats["total"]:
+            print("✅ No pools found with swap indexing issues!")
+            return stats
+        
+        print(f"🚨 Found {stats['total']} pools with potential swap indexing issues")
+        
+        if dry_run or not to_reset:
+            stats["fixed"] = len(to_reset)
+            return stats
+        
+        # Reset all affected pools in a single round trip
+        try:
+            result = await self.db.indexer_progress.delete_many({
+                "chain_id": chain_id,
+                "indexer_type": "swaps",
+                "pool_address": {"$in": to_reset}
+            })
+            stats["fixed"] = len(to_reset)
+            print(f"  ✅ Reset swap progress for {len(to_reset)} pools (deleted {result.deleted_count} records)")
+        except Exception as e:
+            stats["errors"] = len(to_reset)
+            print(f"  ❌ Failed to reset swap progress for {len(to_reset)} pools: {e}")
         
         return stats
     
@@ -149,7 +236,10 @@ class SwapIndexingFixer:
         """Close database connection."""
         self.client.close()
 
-async def main():
+def _build_parser():
+    """Build the CLI argument parser (argparse is only imported when run as a script)."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Fix swap indexing start_block logic")
     parser.add_argument("--chain-id", type=int, required=True, 
                        help="Chain ID to fix (e.g., 8453 for Base)")
@@ -159,8 +249,28 @@ async def main():
                        help="Apply the fixes")
     parser.add_argument("--mongodb-url", default="mongodb://localhost:27017",
                        help="MongoDB connection URL")
-    
-    args = parser.parse_args()
+    parser.add_argument("--pretty", action="store_true",
+                       help="Render per-pool events for humans instead of JSON lines")
+    return parser
+
+def _configure_logging(pretty: bool) -> None:
+    """Configure structlog for per-pool events."""
+    if pretty:
+        structlog.configure(
+            processors=[structlog.processors.add_log_level, structlog.dev.ConsoleRenderer()],
+            logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+            cache_logger_on_first_use=True
+        )
+    else:
+        structlog.configure(
+            processors=[structlog.processors.add_log_level, structlog.processors.JSONRenderer(serializer=orjson.dumps)],
+            logger_factory=structlog.BytesLoggerFactory(file=sys.stdout.buffer),
+            cache_logger_on_first_use=True
+        )
+
+async def main():
+    args = _build_parser().parse_args()
+    _configure_logging(args.pretty)
     
     if not args.dry_run and not args.apply:
         print("❌ Must specify either --dry-run or --apply")
@@ -170,7 +280,7 @@ async def main():
         print("❌ Cannot specify both --dry-run and --apply")
         sys.exit(1)
     
-    fixer = SwapIndexingFixer(args.mongodb_url)
+    fixer = await SwapIndexingFixer.create(args.mongodb_url)
     
     try:
         print("🔧 MoonX Swap Indexing Fixer")
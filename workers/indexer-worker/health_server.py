@@ -6,18 +6,28 @@ compatible with Kubernetes liveness and readiness probes.
 """
 
 import asyncio
-from typing import Dict, Any
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+import time
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
 import uvicorn
 import structlog
 from contextlib import asynccontextmanager
 
-from main import IndexerWorker
+from main import IndexerWorker, utc_now_iso
 
 
 logger = structlog.get_logger()
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
 
 class HealthServer:
     """HTTP server for health checks and monitoring."""
@@ -25,96 +35,136 @@ class HealthServer:
     def __init__(self, worker: IndexerWorker, port: int = 8080):
         self.worker = worker
         self.port = port
-        self.app = FastAPI(
-            title="MoonX Indexer Worker Health API",
-            description="Health check and monitoring endpoints",
-            version="1.0.0"
-        )
-        self._setup_routes()
+        
+        # Short-lived health results shared by overlapping probes and scrapes
+        self._hc_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        self._hc_lock = asyncio.Lock()
+        self._chain_hc_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        
+        self.app = Starlette(routes=self._setup_routes())
+    
+    async def _cached_health(self, ttl: float = 2.0) -> Dict[str, Any]:
+        """Return the worker health status, reusing a result younger than ttl seconds."""
+        ts, health = self._hc_cache
+        if health is not None and time.monotonic() - ts < ttl:
+            return health
+        
+        async with self._hc_lock:
+            # Another probe may have refreshed the cache while we waited
+            ts, health = self._hc_cache
+            if health is not None and time.monotonic() - ts < ttl:
+                return health
+            
+            health = await self.worker.health_check()
+            self._hc_cache = (time.monotonic(), health)
+            return health
+    
+    async def _cached_chain_health(self, chain_id: int, indexer_service, ttl: float = 2.0) -> Dict[str, Any]:
+        """Return a chain indexer's health status, reusing a result younger than ttl seconds."""
+        cached = self._chain_hc_cache.get(chain_id)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        health = await indexer_service.health_check()
+        self._chain_hc_cache[chain_id] = (time.monotonic(), health)
+        return health
     
-    def _setup_routes(self):
+    def _setup_routes(self) -> List[Route]:
         """Setup HTTP routes."""
         
-        @self.app.get("/health", response_class=JSONResponse)
-        async def health_check():
+        async def health_check(request: Request) -> ORJSONResponse:
             """Main health check endpoint."""
             try:
-                health_status = await self.worker.health_check()
+                health_status = await self._cached_health()
                 
                 status_code = 200 if health_status.get("status") == "healthy" else 503
                 
-                return JSONResponse(
+                return ORJSONResponse(
                     content=health_status,
                     status_code=status_code
                 )
             except Exception as e:
                 logger.error("Health check failed", error=str(e))
-                raise HTTPException(
-                    status_code=503,
-                    detail={"status": "unhealthy", "error": str(e)}
+                return ORJSONResponse(
+                    content={"detail": {"status": "unhealthy", "error": str(e)}},
+                    status_code=503
                 )
         
-        @self.app.get("/health/live", response_class=JSONResponse)
-        async def liveness_probe():
+        async def liveness_probe(request: Request) -> ORJSONResponse:
             """Kubernetes liveness probe endpoint."""
             try:
                 # Simple check - is the worker process running?
                 if self.worker.is_running:
-                    return JSONResponse(
-                        content={"status": "alive", "timestamp": "2024-01-01T00:00:00Z"},
+                    return ORJSONResponse(
+                        content={"status": "alive", "timestamp": utc_now_iso()},
                         status_code=200
                     )
                 else:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={"status": "not_running"},
                         status_code=503
                     )
             except Exception as e:
                 logger.error("Liveness probe failed", error=str(e))
-                raise HTTPException(status_code=503, detail=str(e))
+                return ORJSONResponse(content={"detail": str(e)}, status_code=503)
         
-        @self.app.get("/health/ready", response_class=JSONResponse)
-        async def readiness_probe():
+        async def readiness_probe(request: Request) -> ORJSONResponse:
             """Kubernetes readiness probe endpoint."""
             try:
-                # Check if all services are ready to handle requests
-                health_status = await self.worker.health_check()
+                # Consider ready if at least one chain service is healthy,
+                # using the worker's cached status once it has been populated
+                service_count = self.worker.service_count()
+                if service_count:
+                    ready = self.worker.any_service_healthy()
+                else:
+                    health_status = await self._cached_health()
+                    services = health_status.get("services", {})
+                    service_count = len(services)
+                    ready = any(
+                        svc.get("status") == "healthy" 
+                        for svc in services.values()
+                    )
                 
-                # Consider ready if at least one chain service is healthy
-                services = health_status.get("services", {})
-                if services and any(
-                    svc.get("status") == "healthy" 
-                    for svc in services.values()
-                ):
-                    return JSONResponse(
-                        content={"status": "ready", "services": len(services)},
+                if ready:
+                    return ORJSONResponse(
+                        content={"status": "ready", "services": service_count},
                         status_code=200
                     )
                 else:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         content={"status": "not_ready", "reason": "no_healthy_services"},
                         status_code=503
                     )
             except Exception as e:
                 logger.error("Readiness probe failed", error=str(e))
-                raise HTTPException(status_code=503, detail=str(e))
+                return ORJSONResponse(content={"detail": str(e)}, status_code=503)
         
-        @self.app.get("/metrics", response_class=JSONResponse)
-        async def metrics():
+        async def metrics(request: Request) -> ORJSONResponse:
             """Metrics endpoint for monitoring."""
             try:
                 # Get basic metrics from worker
                 metrics_data = {
-                    "timestamp": "2024-01-01T00:00:00Z",
+                    "timestamp": utc_now_iso(),
                     "worker_status": "running" if self.worker.is_running else "stopped",
                     "active_chains": len(self.worker.indexer_services),
                     "chains": {}
                 }
                 
-                # Get metrics from each chain indexer
-                for chain_id, indexer_service in self.worker.indexer_services.items():
+                # Get metrics from each chain indexer concurrently
+                items = list(self.worker.indexer_services.items())
+                results = await asyncio.gather(
+                    *(self._cached_chain_health(chain_id, svc) for chain_id, svc in items),
+                    return_exceptions=True
+                )
+                
+                for (chain_id, _), health in zip(items, results):
+                    if isinstance(health, Exception):
+                        metrics_data["chains"][str(chain_id)] = {
+                            "status": "error",
+                            "error": str(health)
+                        }
+                        continue
                     try:
-                        health = await indexer_service.health_check()
                         metrics_data["chains"][str(chain_id)] = {
                             "status": health.get("status"),
                             "latest_block": health.get("components", {}).get("blockchain", {}).get("latest_block"),
@@ -126,16 +176,15 @@ class HealthServer:
                             "error": str(e)
                         }
                 
-                return JSONResponse(content=metrics_data, status_code=200)
+                return ORJSONResponse(content=metrics_data, status_code=200)
                 
             except Exception as e:
                 logger.error("Metrics endpoint failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
+                return ORJSONResponse(content={"detail": str(e)}, status_code=500)
         
-        @self.app.get("/", response_class=JSONResponse)
-        async def root():
+        async def root(request: Request) -> ORJSONResponse:
             """Root endpoint with basic info."""
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "service": "MoonX Indexer Worker",
                 "version": "1.0.0",
                 "status": "running" if self.worker.is_running else "stopped",
@@ -146,6 +195,14 @@ class HealthServer:
                     "metrics": "/metrics"
                 }
             })
+        
+        return [
+            Route("/health", health_check),
+            Route("/health/live", liveness_probe),
+            Route("/health/ready", readiness_probe),
+            Route("/metrics", metrics),
+            Route("/", root),
+        ]
     
     async def start(self):
         """Start the health server."""
@@ -154,7 +211,11 @@ class HealthServer:
             host="0.0.0.0",
             port=self.port,
             log_level="info",
-            access_log=False
+            access_log=False,
+            # No loop option: serve() runs on the caller's loop, which is uvloop once main is imported
+            http="httptools",
+            limit_concurrency=256,
+            timeout_keep_alive=5
         )
         server = uvicorn.Server(config)
         
@@ -168,7 +229,11 @@ class HealthServer:
             host="0.0.0.0",
             port=self.port,
             log_level="info",
-            access_log=False
+            access_log=False,
+            loop="auto",  # uvloop when installed, like main.py
+            http="httptools",
+            limit_concurrency=256,
+            timeout_keep_alive=5
         )
 
 
@@ -190,5 +255,5 @@ async def start_health_server_with_worker():
 
 
 if __name__ == "__main__":
-    # Run health server with worker
+    # Run health server with worker (importing main already installed uvloop if available)
     asyncio.run(start_health_server_with_worker())
\ No newline at end of file
@@ -15,32 +15,56 @@ Usage:
 import asyncio
 import argparse
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateMany
 from datetime import datetime
 import sys
 
+# Single-field indexes the migration's queries can use. Partial indexes cannot filter on
+# {"$exists": False}, but a plain index stores missing fields as null, so the
+# $exists/null lookups scan only those keys instead of the whole collection.
+MIGRATION_INDEXES = {
+    "migrate_target_block": "target_block",
+    "migrate_started_at": "started_at",
+    "migrate_status": "status",
+}
+
 class ProgressFieldsMigrator:
     def __init__(self, mongodb_url: str = "mongodb://localhost:27017"):
         self.client = AsyncIOMotorClient(mongodb_url)
         self.db = self.client.moonx_indexer
-        
+        self._created_indexes = []
+        
+    async def ensure_indexes(self):
+        """Create the temporary lookup indexes that don't already exist."""
+        existing = await self.db.indexer_progress.index_information()
+        for name, field in MIGRATION_INDEXES.items():
+            if name not in existing:
+                await self.db.indexer_progress.create_index([(field, 1)], name=name)
+                self._created_indexes.append(name)
+    
+    async def drop_indexes(self):
+        """Drop the lookup indexes this run created; they are only needed for the migration."""
+        for name in self._created_indexes:
+            await self.db.indexer_progress.drop_index(name)
+        self._created_indexes.clear()
+    
     async def find_incomplete_records(self):
         """Find progress records missing required fields."""
-        # Find records missing target_block or started_at
-        missing_target = await self.db.indexer_progress.count_documents({
-            "target_block": {"$exists": False}
-        })
-        
-        missing_started = await self.db.indexer_progress.count_documents({
-            "started_at": {"$exists": False}
-        })
-        
-        # Get sample records to understand the issue
-        sample_records = await self.db.indexer_progress.find({
-            "$or": [
-                {"target_block": {"$exists": False}},
-                {"started_at": {"$exists": False}}
-            ]
-        }).limit(5).to_list(None)
+        # Find records missing target_block or started_at, and sample records to understand the issue
+        missing_target, missing_started, sample_records = await asyncio.gather(
+            self.db.indexer_progress.count_documents({
+                "target_block": {"$exists": False}
+            }),
+            self.db.indexer_progress.count_documents({
+                "started_at": {"$exists": False}
+            }),
+            self.db.indexer_progress.find({
+                "$or": [
+                    {"target_block": {"$exists": False}},
+                    {"started_at": {"$exists": False}}
+                ]
+            }).limit(5).to_list(None)
+        )
         
         return {
             "missing_target": missing_target,
@@ -52,64 +76,35 @@ class ProgressFieldsMigrator:
         """Migrate records to add missing fields."""
         current_time = datetime.utcnow()
         
-        # Update records missing target_block
-        if dry_run:
-            target_count = await self.db.indexer_progress.count_documents({
-                "target_block": {"$exists": False}
-            })
-            print(f"  [DRY-RUN] Would update {target_count} records missing target_block")
-        else:
-            result = await self.db.indexer_progress.update_many(
-                {"target_block": {"$exists": False}},
-                {
-                    "$set": {
-                        "target_block": 0  # Default to 0, will be updated by next indexing run
-                    }
-                }
-            )
-            print(f"  ✅ Updated {result.modified_count} records with target_block")
+        missing_target = {"target_block": {"$exists": False}}
+        missing_started = {"started_at": {"$exists": False}}
+        missing_status = {
+            "$or": [
+                {"status": {"$exists": False}},
+                {"status": None}
+            ]
+        }
         
-        # Update records missing started_at
         if dry_run:
-            started_count = await self.db.indexer_progress.count_documents({
-                "started_at": {"$exists": False}
-            })
-            print(f"  [DRY-RUN] Would update {started_count} records missing started_at")
-        else:
-            result = await self.db.indexer_progress.update_many(
-                {"started_at": {"$exists": False}},
-                {
-                    "$set": {
-                        "started_at": current_time
-                    }
-                }
+            target_count, started_count, status_count = await asyncio.gather(
+                self.db.indexer_progress.count_documents(missing_target),
+                self.db.indexer_progress.count_documents(missing_started),
+                self.db.indexer_progress.count_documents(missing_status)
             )
-            print(f"  ✅ Updated {result.modified_count} records with started_at")
-        
-        # Also ensure status field exists with default value
-        if dry_run:
-            status_count = await self.db.indexer_progress.count_documents({
-                "$or": [
-                    {"status": {"$exists": False}},
-                    {"status": None}
-                ]
-            })
+            print(f"  [DRY-RUN] Would update {target_count} records missing target_block")
+            print(f"  [DRY-RUN] Would update {started_count} records missing started_at")
             print(f"  [DRY-RUN] Would update {status_count} records missing status")
-        else:
-            result = await self.db.indexer_progress.update_many(
-                {
-                    "$or": [
-                        {"status": {"$exists": False}},
-                        {"status": None}
-                    ]
-                },
-                {
-                    "$set": {
-                        "status": "running"
-                    }
-                }
-            )
-            print(f"  ✅ Updated {result.modified_count} records with status")
+            return True
+        
+        # One round-trip for all three fixes; the filters are independent, so order doesn't matter
+        result = await self.db.indexer_progress.bulk_write([
+            # Default to 0, will be updated by next indexing run
+            UpdateMany(missing_target, {"$set": {"target_block": 0}}),
+            UpdateMany(missing_started, {"$set": {"started_at": current_time}}),
+            # Also ensure status field exists with default value
+            UpdateMany(missing_status, {"$set": {"status": "running"}})
+        ], ordered=False)
+        print(f"  ✅ Updated {result.modified_count} fields across target_block, started_at and status")
         
         return True
     
@@ -145,6 +140,7 @@ async def main():
         
         # Analyze current state
         print("🔍 Analyzing current progress records...")
+        await migrator.ensure_indexes()
         analysis = await migrator.find_incomplete_records()
         
         print(f"Records missing target_block: {analysis['missing_target']}")
@@ -187,7 +183,10 @@ async def main():
         print(f"❌ Error: {e}")
         sys.exit(1)
     finally:
-        await migrator.close()
+        try:
+            await migrator.drop_indexes()
+        finally:
+            await migrator.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
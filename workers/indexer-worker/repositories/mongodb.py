@@ -8,6 +8,14 @@ from models.pool import PoolInfo, SwapEvent, PoolLiquidity, IndexerProgress, Pri
 
 logger = structlog.get_logger()
 
+# Wire compression for the BSON-heavy pool/progress traffic; the server must advertise a matching compressor
+MONGO_CLIENT_OPTIONS: Dict[str, Any] = {
+    "compressors": "zstd,zlib",
+    "zlibCompressionLevel": 3,
+    "serverSelectionTimeoutMS": 5000,
+    "retryWrites": True,
+}
+
 
 class MongoPoolRepository(PoolRepository):
     """MongoDB implementation of pool repository."""
@@ -23,11 +31,19 @@ class MongoPoolRepository(PoolRepository):
         self.swap_events: Optional[AsyncIOMotorCollection] = None
         self.pool_liquidity: Optional[AsyncIOMotorCollection] = None
         self.price_calculations: Optional[AsyncIOMotorCollection] = None
+        
+        # Number of holders sharing this connection (one repository serves every chain)
+        self._connections = 0
     
     async def connect(self) -> None:
-        """Connect to MongoDB."""
+        """Connect to MongoDB, reusing the client if already connected."""
+        if self._connections:
+            self._connections += 1
+            return
+        
         try:
-            self.client = AsyncIOMotorClient(self.mongodb_url)
+            self._connections = 1
+            self.client = AsyncIOMotorClient(self.mongodb_url, **MONGO_CLIENT_OPTIONS)
             self.db = self.client[self.database_name]
             
             # Initialize collections
@@ -41,11 +57,17 @@ class MongoPoolRepository(PoolRepository):
             
             logger.info("Connected to MongoDB", database=self.database_name)
         except Exception as e:
+            self._connections = 0
             logger.error("Failed to connect to MongoDB", error=str(e))
             raise
     
     async def disconnect(self) -> None:
-        """Disconnect from MongoDB."""
+        """Disconnect from MongoDB once the last holder releases the connection."""
+        if self._connections > 1:
+            self._connections -= 1
+            return
+        
+        self._connections = 0
         if self.client:
             self.client.close()
             logger.info("Disconnected from MongoDB")
@@ -417,11 +439,19 @@ class MongoProgressRepository(ProgressRepository):
         self.client: Optional[AsyncIOMotorClient] = None
         self.db: Optional[AsyncIOMotorDatabase] = None
         self.progress: Optional[AsyncIOMotorCollection] = None
+        
+        # Number of holders sharing this connection (one repository serves every chain)
+        self._connections = 0
     
     async def connect(self) -> None:
-        """Connect to MongoDB."""
+        """Connect to MongoDB, reusing the client if already connected."""
+        if self._connections:
+            self._connections += 1
+            return
+        
         try:
-            self.client = AsyncIOMotorClient(self.mongodb_url)
+            self._connections = 1
+            self.client = AsyncIOMotorClient(self.mongodb_url, **MONGO_CLIENT_OPTIONS)
             self.db = self.client[self.database_name]
             self.progress = self.db.indexer_progress
             
@@ -430,11 +460,17 @@ class MongoProgressRepository(ProgressRepository):
             
             logger.info("Connected to MongoDB for progress tracking", database=self.database_name)
         except Exception as e:
+            self._connections = 0
             logger.error("Failed to connect to MongoDB for progress", error=str(e))
             raise
     
     async def disconnect(self) -> None:
-        """Disconnect from MongoDB."""
+        """Disconnect from MongoDB once the last holder releases the connection."""
+        if self._connections > 1:
+            self._connections -= 1
+            return
+        
+        self._connections = 0
         if self.client:
             self.client.close()
     
@@ -11,33 +11,70 @@ logger = structlog.get_logger()
 class RedisCacheRepository(CacheRepository):
     """Redis implementation of cache repository."""
     
-    def __init__(self, redis_url: str, db: int = 0, key_prefix: str = "moonx:indexer"):
+    def __init__(
+        self,
+        redis_url: str,
+        db: int = 0,
+        key_prefix: str = "moonx:indexer",
+        connection_pool: Optional[redis.ConnectionPool] = None
+    ):
         self.redis_url = redis_url
         self.db = db
         self.key_prefix = key_prefix
+        self.connection_pool = connection_pool
         self.client: Optional[redis.Redis] = None
+        
+        # Number of holders sharing this connection (the worker warms it up before the service starts)
+        self._connections = 0
+    
+    @staticmethod
+    def create_pool(redis_url: str, db: int = 0, max_connections: Optional[int] = None) -> redis.ConnectionPool:
+        """Create a connection pool that several repositories can share."""
+        return redis.ConnectionPool.from_url(
+            redis_url,
+            db=db,
+            max_connections=max_connections,
+            decode_responses=True,
+            socket_timeout=30,
+            socket_connect_timeout=30
+        )
     
     async def connect(self) -> None:
-        """Connect to Redis."""
+        """Connect to Redis, reusing the client if already connected."""
+        if self._connections:
+            self._connections += 1
+            return
+        
         try:
-            self.client = redis.from_url(
-                self.redis_url,
-                db=self.db,
-                decode_responses=True,
-                socket_timeout=30,
-                socket_connect_timeout=30
-            )
+            self._connections = 1
+            if self.connection_pool is not None:
+                # Shared pool: closing this client leaves the pool to its owner
+                self.client = redis.Redis(connection_pool=self.connection_pool)
+            else:
+                self.client = redis.from_url(
+                    self.redis_url,
+                    db=self.db,
+                    decode_responses=True,
+                    socket_timeout=30,
+                    socket_connect_timeout=30
+                )
             
             # Test connection
             await self.client.ping()
             
             logger.info("Connected to Redis", url=self.redis_url, db=self.db)
         except Exception as e:
+            self._connections = 0
             logger.error("Failed to connect to Redis", error=str(e))
             raise
     
     async def disconnect(self) -> None:
-        """Disconnect from Redis."""
+        """Disconnect from Redis once the last holder releases the connection."""
+        if self._connections > 1:
+            self._connections -= 1
+            return
+        
+        self._connections = 0
         if self.client:
             await self.client.close()
             logger.info("Disconnected from Redis")
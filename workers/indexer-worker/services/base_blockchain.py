@@ -2,7 +2,8 @@
 
 from web3 import Web3
 from web3.middleware import geth_poa_middleware
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
 import asyncio
 import aiohttp
 import structlog
@@ -22,6 +23,8 @@ class BaseBlockchainService:
         self.settings = settings or Settings()
         self.w3: Optional[Web3] = None
         self.session: Optional[aiohttp.ClientSession] = None
+        # LRU of eth_getLogs results for confirmed ranges, which can no longer reorg
+        self._logs_cache: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
     
     async def connect(self) -> None:
         """Connect to blockchain RPC with failover support."""
@@ -29,6 +32,21 @@ class BaseBlockchainService:
         primary_urls = getattr(self.chain_config, 'rpc_urls', [self.chain_config.rpc_url])
         rpc_urls = primary_urls + (self.chain_config.backup_rpc_urls or [])
         
+        # One keep-alive session for the service's lifetime, shared by every RPC URL attempt.
+        # The pool is sized so gathered per-protocol calls are not serialized behind
+        # aiohttp's default limit.
+        if self.session is None or self.session.closed:
+            pool_size = self.settings.http_pool_size
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=pool_size,
+                    limit_per_host=pool_size,
+                    keepalive_timeout=30,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.settings.rpc_request_timeout)
+            )
+        
         for i, rpc_url in enumerate(rpc_urls):
             try:
                 # Skip URLs that need API keys if not configured
@@ -44,11 +62,6 @@ class BaseBlockchainService:
                 # Add PoA middleware for some chains
                 self.w3.middleware_onion.inject(geth_poa_middleware, layer=0)
                 
-                # Initialize aiohttp session for async requests
-                self.session = aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=self.settings.rpc_request_timeout)
-                )
-                
                 # Test connection
                 latest_block = await self.get_latest_block()
                 
@@ -74,6 +87,7 @@ class BaseBlockchainService:
         """Disconnect from blockchain."""
         if self.session:
             await self.session.close()
+            self.session = None
         logger.info("Disconnected from blockchain", chain_id=self.chain_config.chain_id)
     
     def get_next_primary_rpc_url(self) -> str:
@@ -261,25 +275,157 @@ class BaseBlockchainService:
         topics: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Get logs from blockchain."""
+        cache_key = self._logs_cache_key(from_block, to_block, address, topics)
+        cached = self._get_cached_logs(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            params = {
-                "fromBlock": hex(from_block),
-                "toBlock": hex(to_block)
-            }
-            
-            if address:
-                params["address"] = address
-            if topics:
-                params["topics"] = topics
-            
+            params = self._log_filter(from_block, to_block, address, topics)
             result = await self._make_rpc_call("eth_getLogs", [params])
-            return result or []
+            logs = result or []
+            self._cache_logs(cache_key, logs)
+            return logs
         except Exception as e:
             logger.error("Failed to get logs",
                         from_block=from_block,
                         to_block=to_block,
                         error=str(e))
             raise
+    
+    async def get_logs_batch(self, requests: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Get logs for several filters using JSON-RPC batch requests.
+        
+        Args:
+            requests: get_logs keyword arguments (from_block, to_block, address, topics) per filter
+            
+        Returns:
+            Logs for each request, in request order
+        """
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(requests)
+        misses = []
+        for i, request in enumerate(requests):
+            cache_key = self._logs_cache_key(**request)
+            results[i] = self._get_cached_logs(cache_key)
+            if results[i] is None:
+                misses.append((i, cache_key, request))
+        
+        batch_size = max(1, self.settings.logs_batch_size)
+        chunks = [misses[i:i + batch_size] for i in range(0, len(misses), batch_size)]
+        chunk_results = await asyncio.gather(
+            *(self._get_logs_chunk([request for _, _, request in chunk]) for chunk in chunks)
+        )
+        for chunk, chunk_logs in zip(chunks, chunk_results):
+            for (i, cache_key, _), logs in zip(chunk, chunk_logs):
+                self._cache_logs(cache_key, logs)
+                results[i] = logs
+        return results
+    
+    async def _get_logs_chunk(self, requests: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Fetch one batch of log filters, falling back to individual calls if batching fails."""
+        calls = [("eth_getLogs", [self._log_filter(**request)]) for request in requests]
+        try:
+            results = await self._make_rpc_batch_call(calls)
+            return [result or [] for result in results]
+        except Exception as e:
+            logger.warning("Batched eth_getLogs failed, falling back to individual calls",
+                          batch_size=len(requests),
+                          error=str(e))
+            return list(await asyncio.gather(*(self.get_logs(**request) for request in requests)))
+    
+    async def _make_rpc_batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """Send several RPC calls in one JSON-RPC batch request and return results in call order."""
+        if not self.session:
+            raise Exception("Session not initialized")
+        
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+            for i, (method, params) in enumerate(calls)
+        ]
+        rpc_url = self.get_next_primary_rpc_url()
+        timeout = aiohttp.ClientTimeout(total=self.settings.rpc_timeout)
+        
+        async with self.session.post(
+            rpc_url,
+            json=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=timeout
+        ) as response:
+            if response.status != 200:
+                raise Exception(f"HTTP {response.status}: {await response.text()}")
+            data = await response.json()
+        
+        # Nodes without batch support answer with a single error object
+        if not isinstance(data, list) or len(data) != len(calls):
+            raise Exception(f"Unexpected batch response: {str(data)[:200]}")
+        
+        results: List[Any] = [None] * len(calls)
+        for item in data:
+            if "error" in item:
+                raise Exception(f"RPC error: {item['error']}")
+            results[item["id"]] = item.get("result")
+        return results
+    
+    def _logs_cache_key(
+        self,
+        from_block: int,
+        to_block: int,
+        address: Optional[str] = None,
+        topics: Optional[List[Any]] = None
+    ) -> Optional[tuple]:
+        """Return the logs cache key for a filter, or None if its range is not yet confirmed."""
+        if self.settings.logs_cache_size <= 0:
+            return None
+        
+        # Reuse the last observed head instead of paying an RPC call per lookup
+        latest_block = getattr(self, '_latest_block_cache', None)
+        if latest_block is None or to_block > latest_block - self.chain_config.confirmation_blocks:
+            return None
+        
+        topics_key = tuple(tuple(t) if isinstance(t, list) else t for t in topics or ())
+        return (address, topics_key, from_block, to_block)
+    
+    def _get_cached_logs(self, cache_key: Optional[tuple]) -> Optional[List[Dict[str, Any]]]:
+        """Return copies of the cached log entries for a key, marking it recently used."""
+        if cache_key is None:
+            return None
+        logs = self._logs_cache.get(cache_key)
+        if logs is None:
+            return None
+        self._logs_cache.move_to_end(cache_key)
+        return [dict(log) for log in logs]
+    
+    def _cache_logs(self, cache_key: Optional[tuple], logs: List[Dict[str, Any]]) -> None:
+        """Store logs for a confirmed range, evicting the least recently used entry."""
+        if cache_key is None:
+            return
+        # Copy each entry so callers editing returned logs can't corrupt later hits;
+        # nested values (the topics list) are still shared and must not be mutated
+        self._logs_cache[cache_key] = [dict(log) for log in logs]
+        self._logs_cache.move_to_end(cache_key)
+        if len(self._logs_cache) > self.settings.logs_cache_size:
+            self._logs_cache.popitem(last=False)
+    
+    @staticmethod
+    def _log_filter(
+        from_block: int,
+        to_block: int,
+        address: Optional[str] = None,
+        topics: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build eth_getLogs filter params."""
+        params = {
+            "fromBlock": hex(from_block),
+            "toBlock": hex(to_block)
+        }
+        
+        if address:
+            params["address"] = address
+        if topics:
+            params["topics"] = topics
+        
+        return params
 
     def _decode_string(self, hex_data: str) -> str:
         """Decode hex string from contract call."""
@@ -56,6 +56,10 @@ class BlockchainService:
         """Get logs from blockchain."""
         return await self.base_blockchain.get_logs(from_block, to_block, address, topics)
     
+    async def get_logs_batch(self, requests: list[Dict[str, Any]]) -> list[list[Dict[str, Any]]]:
+        """Get logs for several filters, batching the eth_getLogs calls."""
+        return await self.base_blockchain.get_logs_batch(requests)
+    
     # Token service methods
     async def get_token_info(self, token_address: str, include_market_data: bool = False):
         """Get token information."""
@@ -585,7 +585,7 @@ class IndexerService:
                 max_scan_blocks = min(self.settings.max_blocks_per_request * 10, 10000)  # Max 10k blocks for first scan
                 
                 # Find the minimum creation block across all enabled protocols
-                enabled_protocols = [p for p in self.chain_config.pools if p.get("enabled", True)]
+                enabled_protocols = self.chain_config.enabled_pools
                 protocol_creation_blocks = [p.get("creation_block", 0) for p in enabled_protocols if p.get("creation_block")]
                 
                 # Safety check: filter out creation blocks that are in the future
@@ -668,7 +668,7 @@ class IndexerService:
                        block_range_size=end_block - start_block + 1)
             
             # Index pools for each protocol CONCURRENTLY
-            enabled_protocols = [p for p in self.chain_config.pools if p.get("enabled", True)]
+            enabled_protocols = self.chain_config.enabled_pools
             
             logger.info("Starting PARALLEL pool indexing for all protocols", 
                        total_protocols=len(self.chain_config.pools),